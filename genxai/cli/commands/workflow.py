@@ -39,7 +39,7 @@ def run_workflow(workflow_path: Path, input_payload: str) -> None:
     shared_memory = workflow_dict.get("memory", {}).get("shared", False)
 
     result = _run_executor(executor, nodes, edges, input_data, shared_memory=shared_memory)
-    click.echo(json.dumps(result, indent=2))
+    click.echo(json.dumps(result.to_dict(), indent=2))
 
 
 def _build_nodes_from_workflow(workflow_dict: Dict[str, Any]):
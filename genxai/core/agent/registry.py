@@ -1,6 +1,6 @@
 """Agent registry for managing agent instances."""
 
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 import logging
 
 from genxai.core.agent.base import Agent
@@ -29,6 +29,24 @@ class AgentRegistry:
         cls._agents[agent.id] = agent
         logger.info(f"Registered agent: {agent.id} (role: {agent.config.role})")
 
+    @classmethod
+    def register_many(cls, agents: Iterable[Agent]) -> None:
+        """Register several agents in one registry update.
+
+        Args:
+            agents: Agent instances to register
+        """
+        batch = {agent.id: agent for agent in agents}
+        if not batch:
+            return
+
+        overwritten = batch.keys() & cls._agents.keys()
+        if overwritten:
+            logger.warning(f"Agents already registered, overwriting: {sorted(overwritten)}")
+
+        cls._agents.update(batch)
+        logger.info(f"Registered {len(batch)} agents: {list(batch)}")
+
     @classmethod
     def get(cls, agent_id: str) -> Optional[Agent]:
         """Get an agent by ID.
@@ -78,6 +96,16 @@ class AgentRegistry:
         """
         return cls._agents.copy()
 
+    @classmethod
+    def restore(cls, agents: Dict[str, Agent]) -> None:
+        """Replace the registry contents, e.g. with an earlier ``get_all()``.
+
+        Args:
+            agents: Dictionary of agent ID to agent instance
+        """
+        cls._agents.clear()
+        cls._agents.update(agents)
+
     @classmethod
     def clear(cls) -> None:
         """Clear all registered agents."""
@@ -31,6 +31,19 @@ from genxai.core.memory.shared import SharedMemoryBus
 
 logger = logging.getLogger(__name__)
 
+# Context entries that only make sense inside a running execution
+_RUNTIME_ONLY_CONTEXT_KEYS = frozenset({"llm_provider", "shared_memory"})
+# Tool results of these types are shared with the result context as-is
+_IMMUTABLE_RESULT_TYPES = (str, int, float, bool, bytes, tuple, frozenset, type(None))
+
+# Tool-call formats recognised by AgentRuntime._parse_tool_calls
+_JSON_TOOL_CALL_RE = re.compile(
+    r'\{[^{}]*"name"\s*:\s*"[^"]+"\s*,\s*"arguments"\s*:\s*\{[^}]*\}\s*\}',
+    re.DOTALL,
+)
+_TEXT_TOOL_CALL_RE = re.compile(r'USE_TOOL:\s*(\w+)\((.*?)\)', re.DOTALL)
+_TOOL_ARG_RE = re.compile(r'(\w+)=(["\'])(.*?)\2')
+
 
 class AgentExecutionError(Exception):
     """Exception raised during agent execution."""
@@ -41,6 +54,9 @@ class AgentExecutionError(Exception):
 class AgentRuntime:
     """Runtime for executing agents."""
 
+    # Most parallel-safe tool calls from one LLM response run at once
+    MAX_PARALLEL_TOOL_CALLS = 4
+
     def __init__(
         self,
         agent: Agent,
@@ -65,6 +81,8 @@ class AgentRuntime:
         self._tools: Dict[str, Any] = {}
         self._memory: Optional[Any] = None
         self._shared_memory = shared_memory
+        # (config fields, prompt) of the last built system prompt
+        self._system_prompt_cache: Optional[tuple] = None
 
         # Initialize LLM provider
         if llm_provider:
@@ -254,13 +272,7 @@ class AgentRuntime:
             await self._update_memory(task, response)
         
         # Build result
-        safe_context: Dict[str, Any]
-        try:
-            safe_context = copy.deepcopy(context)
-        except Exception:
-            safe_context = dict(context)
-        safe_context.pop("llm_provider", None)
-        safe_context.pop("shared_memory", None)
+        safe_context = self._snapshot_context(context)
         result = {
             "agent_id": self.agent.id,
             "task": task,
@@ -295,6 +307,38 @@ class AgentRuntime:
         
         return result
 
+    @staticmethod
+    def _snapshot_context(context: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the execution context for the result dictionary.
+
+        Runtime-only entries are dropped before copying. Tool results are
+        never deep-copied: immutable results are stored by reference and
+        mutable ones get a shallow copy, so tools that want their output
+        fully isolated should return immutable structures (e.g. tuples or
+        ``types.MappingProxyType``).
+        """
+        tool_results: Dict[str, Any] = {}
+        rest: Dict[str, Any] = {}
+        for key, value in context.items():
+            if key in _RUNTIME_ONLY_CONTEXT_KEYS:
+                continue
+            if key.startswith("tool_result_"):
+                if not isinstance(value, _IMMUTABLE_RESULT_TYPES):
+                    value = copy.copy(value)
+                tool_results[key] = value
+            else:
+                rest[key] = value
+
+        try:
+            rest = copy.deepcopy(rest)
+        except Exception:
+            pass
+        return {
+            key: tool_results[key] if key in tool_results else rest[key]
+            for key in context
+            if key in tool_results or key in rest
+        }
+
     async def _rank_tools_for_task(self, task: str) -> Dict[str, Any]:
         """Rank available tools using the LLM ranking utility.
 
@@ -427,9 +471,17 @@ class AgentRuntime:
     def _build_system_prompt(self) -> str:
         """Build system prompt from agent configuration.
 
+        The prompt is reused until the fields it is built from change, so
+        every call sends an identical prefix that providers can cache.
+
         Returns:
             System prompt string
         """
+        config = self.agent.config
+        key = (config.role, config.goal, config.backstory, config.agent_type)
+        if self._system_prompt_cache is not None and self._system_prompt_cache[0] == key:
+            return self._system_prompt_cache[1]
+
         system_parts = []
         
         # Add role
@@ -450,7 +502,9 @@ class AgentRuntime:
         elif self.agent.config.agent_type == "collaborative":
             system_parts.append("\nYou should work well with other agents and coordinate effectively.")
         
-        return "\n".join(system_parts)
+        system_prompt = "\n".join(system_parts)
+        self._system_prompt_cache = (key, system_prompt)
+        return system_prompt
 
     async def _get_llm_response(self, prompt: str, memory_context: str = "") -> str:
         """Get response from LLM with context window management.
@@ -593,7 +647,8 @@ class AgentRuntime:
         schemas: List[Dict[str, Any]] = []
         for tool in self._tools.values():
             if hasattr(tool, "get_schema"):
-                schema = tool.get_schema()
+                # Tool instances memoize their schema; duck-typed tools may not
+                schema = getattr(tool, "schema_dict", None) or tool.get_schema()
                 parameters = schema.get("parameters") or {
                     "type": "object",
                     "properties": {},
@@ -663,12 +718,16 @@ class AgentRuntime:
         if not tool_calls:
             return response.content
 
+        results = await self._execute_tool_calls(
+            [{"name": call["name"], "arguments": call["arguments"]} for call in tool_calls],
+            context,
+        )
+        # Let every call finish before surfacing the first failure
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         tool_messages: List[Dict[str, Any]] = []
-        for call in tool_calls:
-            result = await self._execute_tool(
-                {"name": call["name"], "arguments": call["arguments"]},
-                context,
-            )
+        for call, result in zip(tool_calls, results, strict=True):
             serialized = self._serialize_tool_result(result)
             tool_messages.append(
                 {
@@ -824,27 +883,26 @@ class AgentRuntime:
             
             logger.info(f"Tool iteration {iteration + 1}: Found {len(tool_calls)} tool calls")
             
-            # Execute tools in this iteration
+            outcomes = await self._execute_tool_calls(tool_calls, context)
             iteration_results = []
-            for tool_call in tool_calls:
-                try:
-                    result = await self._execute_tool(tool_call, context)
-                    iteration_results.append({
-                        "tool": tool_call["name"],
-                        "success": True,
-                        "result": result,
-                        "iteration": iteration + 1,
-                    })
-                    # Update context with tool result for chaining
-                    context[f"tool_result_{tool_call['name']}"] = result
-                except Exception as e:
-                    logger.error(f"Tool {tool_call['name']} failed: {e}")
+            for tool_call, outcome in zip(tool_calls, outcomes, strict=True):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Tool {tool_call['name']} failed: {outcome}")
                     iteration_results.append({
                         "tool": tool_call["name"],
                         "success": False,
-                        "error": str(e),
+                        "error": str(outcome),
                         "iteration": iteration + 1,
                     })
+                    continue
+                iteration_results.append({
+                    "tool": tool_call["name"],
+                    "success": True,
+                    "result": outcome,
+                    "iteration": iteration + 1,
+                })
+                # Update context with tool result for chaining
+                context[f"tool_result_{tool_call['name']}"] = outcome
             
             all_tool_results.extend(iteration_results)
             
@@ -870,19 +928,12 @@ class AgentRuntime:
         Returns:
             List of tool call dictionaries
         """
-        import json
-        import re
-        
         tool_calls = []
         
         # Try to parse JSON function calls - look for complete JSON objects
+        # with name and arguments fields
         try:
-            # Pattern to match JSON objects with name and arguments fields
-            # This handles nested objects in arguments
-            json_pattern = r'\{[^{}]*"name"\s*:\s*"[^"]+"\s*,\s*"arguments"\s*:\s*\{[^}]*\}\s*\}'
-            matches = re.findall(json_pattern, response, re.DOTALL)
-            
-            for match in matches:
+            for match in _JSON_TOOL_CALL_RE.findall(response):
                 try:
                     call = json.loads(match)
                     if "name" in call and "arguments" in call:
@@ -907,18 +958,13 @@ class AgentRuntime:
             logger.debug(f"Failed to parse JSON tool calls: {e}")
         
         # Try to parse text-based tool calls
-        text_pattern = r'USE_TOOL:\s*(\w+)\((.*?)\)'
-        matches = re.findall(text_pattern, response, re.DOTALL)
-        
-        for tool_name, args_str in matches:
+        for tool_name, args_str in _TEXT_TOOL_CALL_RE.findall(response):
             try:
                 # Parse arguments
                 arguments = {}
                 if args_str.strip():
                     # Parse key="value" pairs
-                    arg_pattern = r'(\w+)=(["\'])(.*?)\2'
-                    arg_matches = re.findall(arg_pattern, args_str)
-                    for key, _, value in arg_matches:
+                    for key, _, value in _TOOL_ARG_RE.findall(args_str):
                         arguments[key] = value
                 
                 tool_calls.append({
@@ -930,6 +976,56 @@ class AgentRuntime:
         
         return tool_calls
     
+    async def _execute_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        context: Dict[str, Any],
+    ) -> List[Any]:
+        """Execute the tool calls from one LLM response.
+
+        The calls run concurrently, at most MAX_PARALLEL_TOOL_CALLS at a time,
+        only when every tool involved is marked ``parallel_safe``; otherwise
+        they run one after another in the order given.
+
+        Args:
+            tool_calls: Tool call dictionaries with name and arguments
+            context: Execution context
+
+        Returns:
+            Each call's result, or the exception it raised, in call order
+
+        Raises:
+            asyncio.CancelledError: If a call was cancelled
+        """
+        parallel = len(tool_calls) > 1 and all(
+            getattr(self._tools.get(call["name"]), "parallel_safe", False)
+            for call in tool_calls
+        )
+        if not parallel:
+            outcomes: List[Any] = []
+            for tool_call in tool_calls:
+                try:
+                    outcomes.append(await self._execute_tool(tool_call, context))
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
+
+        semaphore = asyncio.Semaphore(self.MAX_PARALLEL_TOOL_CALLS)
+
+        async def run(tool_call: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self._execute_tool(tool_call, context)
+
+        outcomes = await asyncio.gather(
+            *(run(tool_call) for tool_call in tool_calls),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            # Only tool failures are reported per call; cancellation propagates
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+        return outcomes
+
     async def _execute_tool(
         self,
         tool_call: Dict[str, Any],
@@ -997,12 +1093,17 @@ class AgentRuntime:
             Final formatted response
         """
         # Build tool results summary
-        results_text = "\n\nTool Execution Results:\n"
-        for result in tool_results:
-            if result["success"]:
-                results_text += f"- {result['tool']}: {result['result']}\n"
-            else:
-                results_text += f"- {result['tool']}: ERROR - {result['error']}\n"
+        results_text = "".join(
+            [
+                "\n\nTool Execution Results:\n",
+                *(
+                    f"- {result['tool']}: {result['result']}\n"
+                    if result["success"]
+                    else f"- {result['tool']}: ERROR - {result['error']}\n"
+                    for result in tool_results
+                ),
+            ]
+        )
         
         # Ask LLM to incorporate tool results into final response
         follow_up_prompt = (
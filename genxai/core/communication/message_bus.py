@@ -1,9 +1,10 @@
 """Message bus for agent-to-agent communication."""
 
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import islice
 import asyncio
 import logging
 
@@ -29,12 +30,43 @@ class Message(BaseModel):
 class MessageBus:
     """Central message bus for agent communication."""
 
-    def __init__(self) -> None:
-        """Initialize message bus."""
+    def __init__(self, history_limit: Optional[int] = 10000) -> None:
+        """Initialize message bus.
+
+        Args:
+            history_limit: Maximum number of messages kept in history
+                (None for unbounded)
+        """
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self._message_history: List[Message] = []
+        self._message_history: Deque[Message] = deque(maxlen=history_limit)
+        # Per-agent views of the history, in the same order, for filtered reads
+        self._agent_history: Dict[str, Deque[Message]] = defaultdict(deque)
         self._message_count = 0
 
+    @staticmethod
+    def _participants(message: Message) -> Set[str]:
+        return {agent for agent in (message.sender, message.recipient) if agent}
+
+    def _record(self, message: Message) -> None:
+        """Append a message to history, keeping per-agent views in sync."""
+        history = self._message_history
+        if history.maxlen == 0:
+            # History is disabled, so per-agent views stay empty as well
+            return
+        if history.maxlen is not None and len(history) == history.maxlen:
+            # The oldest message is also the oldest in each of its agents' views
+            oldest = history[0]
+            for agent_id in self._participants(oldest):
+                agent_history = self._agent_history.get(agent_id)
+                if agent_history and agent_history[0] is oldest:
+                    agent_history.popleft()
+                    if not agent_history:
+                        del self._agent_history[agent_id]
+
+        history.append(message)
+        for agent_id in self._participants(message):
+            self._agent_history[agent_id].append(message)
+
     async def send(self, message: Message) -> None:
         """Send a message to a specific recipient.
 
@@ -43,7 +75,7 @@ class MessageBus:
         """
         self._message_count += 1
         message.id = f"msg_{self._message_count}"
-        self._message_history.append(message)
+        self._record(message)
 
         logger.info(f"Message sent: {message.sender} -> {message.recipient}")
 
@@ -65,7 +97,7 @@ class MessageBus:
         self._message_count += 1
         message.id = f"msg_{self._message_count}"
         message.recipient = None  # Broadcast has no specific recipient
-        self._message_history.append(message)
+        self._record(message)
 
         logger.info(f"Message broadcast from {message.sender} to group: {group or 'all'}")
 
@@ -155,23 +187,23 @@ class MessageBus:
         Returns:
             List of messages
         """
-        messages = self._message_history
-
         if agent_id:
-            messages = [
-                m
-                for m in messages
-                if m.sender == agent_id or m.recipient == agent_id
-            ]
+            messages = self._agent_history.get(agent_id, ())
+        else:
+            messages = self._message_history
 
         if limit:
-            messages = messages[-limit:]
+            # Read only the tail instead of copying the whole history
+            tail = list(islice(reversed(messages), limit))
+            tail.reverse()
+            return tail
 
-        return messages
+        return list(messages)
 
     def clear_history(self) -> None:
         """Clear message history."""
         self._message_history.clear()
+        self._agent_history.clear()
         logger.info("Message history cleared")
 
     def get_stats(self) -> Dict[str, Any]:
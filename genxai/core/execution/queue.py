@@ -69,6 +69,9 @@ class WorkerQueueEngine:
         self._workers: list[asyncio.Task[None]] = []
         self._running = False
         self._handler_registry = handler_registry or {}
+        self._unfinished = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
 
     def register_handler(
         self,
@@ -115,13 +118,39 @@ class WorkerQueueEngine:
             metadata={**(metadata or {}), "handler_name": handler_name},
         )
         await self._backend.put(task)
+        self._unfinished += 1
+        self._idle.clear()
         return task_id
 
+    async def wait_idle(self, timeout: Optional[float] = None) -> None:
+        """Wait until every task enqueued through this engine has finished.
+
+        A task counts as finished once its handler succeeds or its retries
+        are exhausted.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Raises:
+            asyncio.TimeoutError: If tasks are still pending after timeout
+        """
+        await asyncio.wait_for(self._idle.wait(), timeout)
+
+    def _task_done(self) -> None:
+        # Tasks put on a shared backend by other producers were never counted here
+        if self._unfinished:
+            self._unfinished -= 1
+        if not self._unfinished:
+            self._idle.set()
+
     async def _worker_loop(self, worker_id: int) -> None:
         while self._running:
             try:
                 task = await self._backend.get()
-                await self._execute_with_retry(task)
+                try:
+                    await self._execute_with_retry(task)
+                finally:
+                    self._task_done()
                 logger.debug(
                     "Worker %s processed task %s", worker_id, task.task_id
                 )
@@ -5,6 +5,7 @@ from genxai.core.graph.edges import Edge
 from genxai.core.graph.engine import Graph
 from genxai.core.graph.executor import (
     EnhancedGraph,
+    ExecutionResult,
     WorkflowExecutor,
     execute_workflow_sync,
 )
@@ -22,6 +23,7 @@ __all__ = [
     "Edge",
     "Graph",
     "EnhancedGraph",
+    "ExecutionResult",
     "WorkflowExecutor",
     "execute_workflow_sync",
     "WorkflowCheckpoint",
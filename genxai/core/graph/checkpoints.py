@@ -4,12 +4,85 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Optional
 import json
+import math
+import re
 
 from genxai.core.graph.nodes import NodeStatus
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+# Hand datetimes and dataclasses to _json_default so orjson writes the same
+# values as the stdlib encoder. Non-ASCII text is written as UTF-8 by orjson
+# and \u-escaped by json, so the files are JSON-equivalent, not byte-identical.
+_ORJSON_OPTIONS = (
+    (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if ORJSON_AVAILABLE
+    else 0
+)
+
+
+def _json_default(obj: Any) -> Any:
+    # orjson always writes Enum members by value, so the stdlib path does too
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Whether data holds a NaN/Infinity float, which orjson writes as null."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when it can match json."""
+    if ORJSON_AVAILABLE and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits, which json writes fine
+            pass
+    return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+
+
+# orjson reads integers beyond 64 bits as lossy floats, so files with a run of
+# 19+ digits (the shortest that can overflow, even inside a string) go to json
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it reads the same values as json."""
+    if ORJSON_AVAILABLE and not _LONG_DIGITS_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity tokens, which json writes and accepts
+            pass
+    return json.loads(raw)
+
 
 @dataclass
 class WorkflowCheckpoint:
@@ -50,14 +123,14 @@ class WorkflowCheckpointManager:
     def save(self, checkpoint: WorkflowCheckpoint) -> Path:
         self.base_dir.mkdir(parents=True, exist_ok=True)
         path = self.base_dir / f"checkpoint_{checkpoint.name}.json"
-        path.write_text(json.dumps(checkpoint.to_dict(), indent=2, default=str))
+        path.write_bytes(_dump_json(checkpoint.to_dict()))
         return path
 
     def load(self, name: str) -> WorkflowCheckpoint:
         path = self.base_dir / f"checkpoint_{name}.json"
         if not path.exists():
             raise FileNotFoundError(f"Checkpoint not found: {path}")
-        data = json.loads(path.read_text())
+        data = _load_json(path.read_bytes())
         return WorkflowCheckpoint.from_dict(data)
 
 
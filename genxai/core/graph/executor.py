@@ -1,8 +1,10 @@
 """Workflow execution engine for GenXAI."""
 
 import asyncio
+from collections.abc import Iterator, Mapping
 import copy
-from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
 import logging
 from pathlib import Path
 
@@ -37,6 +39,46 @@ from genxai.utils.enterprise_compat import (
 
 logger = logging.getLogger(__name__)
 
+# Keys exposed by ExecutionResult's mapping view, matching the dicts
+# WorkflowExecutor.execute used to return.
+_SUCCESS_RESULT_KEYS = ("status", "run_id", "result", "node_events", "nodes_executed", "message")
+_ERROR_RESULT_KEYS = ("status", "run_id", "error", "message")
+
+
+@dataclass(slots=True, eq=False)
+class ExecutionResult(Mapping[str, Any]):
+    """Outcome of a :class:`WorkflowExecutor` run.
+
+    A read-only mapping over the keys of the previous dict return value, so
+    ``result["status"]``, ``dict(result)``, ``{**result}`` and comparison with a
+    dict keep working. Use :meth:`to_dict` for a mutable or JSON-serializable copy.
+    """
+
+    status: str
+    run_id: str
+    message: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    node_events: List[Dict[str, Any]] = field(default_factory=list)
+    nodes_executed: int = 0
+
+    def _keys(self) -> tuple[str, ...]:
+        return _ERROR_RESULT_KEYS if self.status == "error" else _SUCCESS_RESULT_KEYS
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self._keys()}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
 
 class EnhancedGraph(Graph):
     """Enhanced graph with agent execution support.
@@ -239,41 +281,49 @@ class WorkflowExecutor:
             ToolRegistry.register(file_reader)
             logger.info("Registered file_reader tool")
 
-    def _create_agents_from_nodes(self, nodes: List[Dict[str, Any]]) -> None:
+    def _create_agents_from_nodes(self, nodes: Sequence[Dict[str, Any]]) -> None:
         """Create and register agents from workflow nodes.
 
         Args:
             nodes: List of workflow nodes
         """
-        for node in nodes:
-            if node.get("type") == "agent":
-                agent_id = node.get("id")
-                config = node.get("config", {})
-                
-                # Extract agent configuration
-                role = config.get("role", "Agent")
-                goal = config.get("goal", "Process tasks")
-                backstory = config.get("backstory", "")
-                tools = config.get("tools", [])
-                llm_model = config.get("llm_model", "gpt-4")
-                temperature = config.get("temperature", 0.7)
-
-                # Create agent
-                agent = AgentFactory.create_agent(
-                    id=agent_id,
-                    role=role,
-                    goal=goal,
-                    backstory=backstory,
-                    tools=tools,
-                    llm_model=llm_model,
-                    temperature=temperature,
-                )
+        AgentRegistry.register_many(
+            self._create_agent(node) for node in nodes if node.get("type") == "agent"
+        )
+
+    def _create_agent(self, node: Dict[str, Any]) -> Agent:
+        """Create an agent from an agent node definition.
+
+        Args:
+            node: Workflow node of type ``"agent"``
 
-                # Register agent
-                AgentRegistry.register(agent)
-                logger.info(f"Created and registered agent: {agent_id}")
+        Returns:
+            Agent instance (not yet registered)
+        """
+        agent_id = node.get("id")
+        config = node.get("config", {})
+
+        # Extract agent configuration
+        role = config.get("role", "Agent")
+        goal = config.get("goal", "Process tasks")
+        backstory = config.get("backstory", "")
+        tools = config.get("tools", [])
+        llm_model = config.get("llm_model", "gpt-4")
+        temperature = config.get("temperature", 0.7)
+
+        return AgentFactory.create_agent(
+            id=agent_id,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            tools=tools,
+            llm_model=llm_model,
+            temperature=temperature,
+        )
 
-    def _build_graph(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]) -> EnhancedGraph:
+    def _build_graph(
+        self, nodes: Sequence[Dict[str, Any]], edges: Sequence[Dict[str, Any]]
+    ) -> EnhancedGraph:
         """Build GenXAI graph from workflow definition.
 
         Args:
@@ -283,52 +333,85 @@ class WorkflowExecutor:
         Returns:
             Constructed graph
         """
+        graph = self._new_graph()
+        for node in nodes:
+            self._add_graph_node(graph, node)
+        self._add_graph_edges(graph, edges)
+        return graph
+
+    def _build_and_register(
+        self, nodes: Sequence[Dict[str, Any]], edges: Sequence[Dict[str, Any]]
+    ) -> EnhancedGraph:
+        """Register workflow agents and build the graph in a single pass over nodes.
+
+        Equivalent to ``_create_agents_from_nodes`` followed by ``_build_graph``.
+
+        Args:
+            nodes: List of workflow nodes
+            edges: List of workflow edges
+
+        Returns:
+            Constructed graph
+        """
+        graph = self._new_graph()
+        agents: List[Agent] = []
+        for node in nodes:
+            if node.get("type") == "agent":
+                agents.append(self._create_agent(node))
+            self._add_graph_node(graph, node)
+        AgentRegistry.register_many(agents)
+        self._add_graph_edges(graph, edges)
+        return graph
+
+    def _new_graph(self) -> EnhancedGraph:
         graph = EnhancedGraph(name="workflow")
         graph.openai_api_key = self.openai_api_key
         graph.anthropic_api_key = self.anthropic_api_key
+        return graph
 
-        # Add nodes
-        for node in nodes:
-            node_id = node.get("id")
-            node_type = node.get("type")
-            config = node.get("config", {})
-
-            # Support some common aliases used by the Studio UI
-            # - "start" behaves like an input node
-            # - "end" behaves like an output node
-            if node_type in {"input", "start"}:
-                graph.add_node(InputNode(id=node_id))
-            elif node_type in {"output", "end"}:
-                graph.add_node(OutputNode(id=node_id))
-            elif node_type == "agent":
-                graph.add_node(AgentNode(id=node_id, agent_id=node_id))
-            elif node_type == "tool":
-                tool_name = config.get("tool_name") or config.get("name") or "tool"
-                graph.add_node(ToolNode(id=node_id, tool_name=tool_name))
-            elif node_type == "decision":
-                condition = config.get("condition", "")
-                graph.add_node(ConditionNode(id=node_id, condition=condition))
-            elif node_type == "subgraph":
-                workflow_id = config.get("workflow_id") or config.get("subgraph_id") or config.get("workflow")
-                if workflow_id:
-                    graph.add_node(SubgraphNode(id=node_id, workflow_id=workflow_id))
-                else:
-                    graph.add_node(
-                        Node(
-                            id=node_id,
-                            type=NodeType.SUBGRAPH,
-                            config=NodeConfig(type=NodeType.SUBGRAPH, data={"workflow_id": ""}),
-                        )
-                    )
-                    logger.warning(f"Subgraph node '{node_id}' missing workflow_id")
-            elif node_type == "loop":
-                condition = config.get("condition", "")
-                max_iterations = int(config.get("max_iterations", 5))
-                graph.add_node(LoopNode(id=node_id, condition=condition, max_iterations=max_iterations))
+    def _add_graph_node(self, graph: EnhancedGraph, node: Dict[str, Any]) -> None:
+        """Add the graph node matching a workflow node definition."""
+        node_id = node.get("id")
+        node_type = node.get("type")
+        config = node.get("config", {})
+
+        # Support some common aliases used by the Studio UI
+        # - "start" behaves like an input node
+        # - "end" behaves like an output node
+        if node_type in {"input", "start"}:
+            graph.add_node(InputNode(id=node_id))
+        elif node_type in {"output", "end"}:
+            graph.add_node(OutputNode(id=node_id))
+        elif node_type == "agent":
+            graph.add_node(AgentNode(id=node_id, agent_id=node_id))
+        elif node_type == "tool":
+            tool_name = config.get("tool_name") or config.get("name") or "tool"
+            graph.add_node(ToolNode(id=node_id, tool_name=tool_name))
+        elif node_type == "decision":
+            condition = config.get("condition", "")
+            graph.add_node(ConditionNode(id=node_id, condition=condition))
+        elif node_type == "subgraph":
+            workflow_id = config.get("workflow_id") or config.get("subgraph_id") or config.get("workflow")
+            if workflow_id:
+                graph.add_node(SubgraphNode(id=node_id, workflow_id=workflow_id))
             else:
-                logger.warning(f"Unknown node type: {node_type}")
+                graph.add_node(
+                    Node(
+                        id=node_id,
+                        type=NodeType.SUBGRAPH,
+                        config=NodeConfig(type=NodeType.SUBGRAPH, data={"workflow_id": ""}),
+                    )
+                )
+                logger.warning(f"Subgraph node '{node_id}' missing workflow_id")
+        elif node_type == "loop":
+            condition = config.get("condition", "")
+            max_iterations = int(config.get("max_iterations", 5))
+            graph.add_node(LoopNode(id=node_id, condition=condition, max_iterations=max_iterations))
+        else:
+            logger.warning(f"Unknown node type: {node_type}")
 
-        # Add edges
+    def _add_graph_edges(self, graph: EnhancedGraph, edges: Sequence[Dict[str, Any]]) -> None:
+        """Add workflow edge definitions to the graph."""
         for edge in edges:
             source = edge.get("source")
             target = edge.get("target")
@@ -347,8 +430,6 @@ class WorkflowExecutor:
                 # Regular edge
                 graph.add_edge(Edge(source=source, target=target))
 
-        return graph
-
     def _evaluate_condition(self, state: Dict[str, Any], condition: str) -> bool:
         """Evaluate a condition string.
 
@@ -369,8 +450,8 @@ class WorkflowExecutor:
 
     async def execute(
         self, 
-        nodes: List[Dict[str, Any]], 
-        edges: List[Dict[str, Any]], 
+        nodes: Sequence[Dict[str, Any]], 
+        edges: Sequence[Dict[str, Any]], 
         input_data: Dict[str, Any],
         run_id: Optional[str] = None,
         checkpoint_dir: Optional[str] = None,
@@ -379,7 +460,7 @@ class WorkflowExecutor:
         event_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
         shared_memory: bool = False,
         llm_provider: Optional[Any] = None,
-    ) -> Dict[str, Any]:
+    ) -> ExecutionResult:
         """Execute a workflow.
 
         Args:
@@ -396,18 +477,18 @@ class WorkflowExecutor:
         try:
             logger.info("Starting workflow execution")
 
-            # Apply model override if provided
+            # Apply model override if provided, on copies so the caller's
+            # node definitions are left untouched
             if model_override:
-                for node in nodes:
-                    if node.get("type") == "agent":
-                        config = node.setdefault("config", {})
-                        config["llm_model"] = model_override
-
-            # Create agents from nodes
-            self._create_agents_from_nodes(nodes)
-
-            # Build graph
-            graph = self._build_graph(nodes, edges)
+                nodes = [
+                    {**node, "config": {**(node.get("config") or {}), "llm_model": model_override}}
+                    if node.get("type") == "agent"
+                    else node
+                    for node in nodes
+                ]
+
+            # Create agents and build graph
+            graph = self._build_and_register(nodes, edges)
             graph.llm_provider = llm_provider
             if shared_memory:
                 graph.set_shared_memory(SharedMemoryBus())
@@ -448,14 +529,14 @@ class WorkflowExecutor:
                 result=result,
                 completed=True,
             )
-            return {
-                "status": "success",
-                "run_id": run_id,
-                "result": result,
-                "node_events": result.get("node_events", []),
-                "nodes_executed": len(graph.nodes),
-                "message": "Workflow executed successfully"
-            }
+            return ExecutionResult(
+                status="success",
+                run_id=run_id,
+                result=result,
+                node_events=result.get("node_events", []),
+                nodes_executed=len(graph.nodes),
+                message="Workflow executed successfully",
+            )
 
         except Exception as e:
             logger.error(f"Workflow execution failed: {e}", exc_info=True)
@@ -465,12 +546,12 @@ class WorkflowExecutor:
                 error=str(e),
                 completed=True,
             )
-            return {
-                "status": "error",
-                "run_id": run_id,
-                "error": str(e),
-                "message": f"Workflow execution failed: {str(e)}"
-            }
+            return ExecutionResult(
+                status="error",
+                run_id=run_id,
+                error=str(e),
+                message=f"Workflow execution failed: {str(e)}",
+            )
 
         finally:
             # Cleanup: Clear registries for next execution
@@ -527,14 +608,14 @@ class WorkflowExecutor:
 
 
 def execute_workflow_sync(
-    nodes: List[Dict[str, Any]],
-    edges: List[Dict[str, Any]],
+    nodes: Sequence[Dict[str, Any]],
+    edges: Sequence[Dict[str, Any]],
     input_data: Dict[str, Any],
     openai_api_key: Optional[str] = None,
     anthropic_api_key: Optional[str] = None,
     model_override: Optional[str] = None,
     shared_memory: bool = False,
-) -> Dict[str, Any]:
+) -> ExecutionResult:
     """Synchronous wrapper for workflow execution.
     
     This is a convenience function for executing workflows in
@@ -574,15 +655,15 @@ def execute_workflow_sync(
 
 
 async def execute_workflow_async(
-    nodes: List[Dict[str, Any]],
-    edges: List[Dict[str, Any]],
+    nodes: Sequence[Dict[str, Any]],
+    edges: Sequence[Dict[str, Any]],
     input_data: Dict[str, Any],
     openai_api_key: Optional[str] = None,
     anthropic_api_key: Optional[str] = None,
     model_override: Optional[str] = None,
     event_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
     shared_memory: bool = False,
-) -> Dict[str, Any]:
+) -> ExecutionResult:
     """Async convenience function for workflow execution.
 
     This is the correct entry point when you're *already* inside an asyncio
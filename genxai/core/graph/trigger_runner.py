@@ -41,4 +41,4 @@ class TriggerWorkflowRunner:
             edges=self.edges,
             input_data=input_data,
         )
-        return result
\ No newline at end of file
+        return result.to_dict()
\ No newline at end of file
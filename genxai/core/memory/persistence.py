@@ -7,10 +7,68 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 import json
 import logging
+import math
+import re
 import sqlite3
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# str() datetimes ourselves so files match the stdlib json output.
+_ORJSON_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    if ORJSON_AVAILABLE
+    else 0
+)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Whether data holds a NaN/Infinity float, which orjson writes as null."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when it can match json."""
+    if ORJSON_AVAILABLE and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits, which json writes fine
+            pass
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+# orjson reads integers beyond 64 bits as lossy floats, so files with a run of
+# 19+ digits (the shortest that can overflow, even inside a string) go to json
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it reads the same values as json."""
+    if ORJSON_AVAILABLE and not _LONG_DIGITS_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity tokens, which json writes and accepts
+            pass
+    return json.loads(raw)
+
 
 @dataclass
 class MemoryPersistenceConfig:
@@ -53,8 +111,7 @@ class JsonMemoryStore:
             return []
 
         try:
-            with path.open("r", encoding="utf-8") as file:
-                data = json.load(file)
+            data = _load_json(path.read_bytes())
             if isinstance(data, list):
                 return data
             logger.warning("Unexpected data format in %s", path)
@@ -71,8 +128,7 @@ class JsonMemoryStore:
         self._ensure_dir()
         path = self.config.resolve(filename)
         try:
-            with path.open("w", encoding="utf-8") as file:
-                json.dump(list(items), file, indent=2, default=str)
+            path.write_bytes(_dump_json(list(items)))
         except Exception as exc:
             logger.error("Failed to save %s: %s", path, exc)
 
@@ -86,8 +142,7 @@ class JsonMemoryStore:
             return {}
 
         try:
-            with path.open("r", encoding="utf-8") as file:
-                data = json.load(file)
+            data = _load_json(path.read_bytes())
             if isinstance(data, dict):
                 return data
             logger.warning("Unexpected data format in %s", path)
@@ -104,8 +159,7 @@ class JsonMemoryStore:
         self._ensure_dir()
         path = self.config.resolve(filename)
         try:
-            with path.open("w", encoding="utf-8") as file:
-                json.dump(data, file, indent=2, default=str)
+            path.write_bytes(_dump_json(data))
         except Exception as exc:
             logger.error("Failed to save %s: %s", path, exc)
 
@@ -113,9 +167,17 @@ class JsonMemoryStore:
 class SqliteMemoryStore:
     """SQLite-backed key/value store for memory persistence."""
 
-    def __init__(self, config: MemoryPersistenceConfig) -> None:
+    def __init__(
+        self,
+        config: MemoryPersistenceConfig,
+        pragma_overrides: Optional[Dict[str, Any]] = None,
+    ) -> None:
         self.config = config
         self._initialized = False
+        self._pragmas = dict(pragma_overrides or {})
+        for name, value in self._pragmas.items():
+            if not name.isidentifier() or not str(value).replace("_", "").isalnum():
+                raise ValueError(f"Invalid SQLite pragma override: {name}={value!r}")
 
     def _ensure_db(self) -> None:
         if not self.config.enabled:
@@ -123,8 +185,7 @@ class SqliteMemoryStore:
         if self._initialized:
             return
         self.config.base_dir.mkdir(parents=True, exist_ok=True)
-        db_path = self.config.resolve_sqlite_path()
-        conn = sqlite3.connect(db_path)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             cursor.execute(
@@ -152,9 +213,15 @@ class SqliteMemoryStore:
         finally:
             conn.close()
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.config.resolve_sqlite_path())
+        for name, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
     def _get_connection(self) -> sqlite3.Connection:
         self._ensure_db()
-        return sqlite3.connect(self.config.resolve_sqlite_path())
+        return self._connect()
 
     def load_list(self, filename: str) -> List[Dict[str, Any]]:
         if not self.config.enabled:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Callable, Awaitable
+from typing import Any, Dict, List, Optional, Callable, Awaitable, Tuple
 import asyncio
 import logging
 
@@ -12,6 +12,8 @@ from genxai.utils.enterprise_compat import get_current_user, get_policy_engine,
 
 logger = logging.getLogger(__name__)
 
+SharedMemoryCallback = Callable[["SharedMemoryEntry"], Awaitable[None]]
+
 
 @dataclass
 class SharedMemoryEntry:
@@ -26,7 +28,8 @@ class SharedMemoryBus:
 
     def __init__(self) -> None:
         self._store: Dict[str, SharedMemoryEntry] = {}
-        self._subscribers: Dict[str, List[Callable[[SharedMemoryEntry], Awaitable[None]]]] = {}
+        # Tuples, rebuilt on subscribe, so publishing never copies the list
+        self._subscribers: Dict[str, Tuple[SharedMemoryCallback, ...]] = {}
         self._lock = asyncio.Lock()
 
     async def set(self, key: str, value: Any, metadata: Optional[Dict[str, Any]] = None) -> None:
@@ -48,14 +51,25 @@ class SharedMemoryBus:
     def list_keys(self) -> List[str]:
         return list(self._store.keys())
 
-    def subscribe(
-        self, key: str, callback: Callable[[SharedMemoryEntry], Awaitable[None]]
-    ) -> None:
-        self._subscribers.setdefault(key, []).append(callback)
+    def subscribe(self, key: str, callback: SharedMemoryCallback) -> None:
+        self._subscribers[key] = (*self._subscribers.get(key, ()), callback)
 
     async def _notify(self, key: str, entry: SharedMemoryEntry) -> None:
-        for callback in self._subscribers.get(key, []):
-            try:
-                await callback(entry)
-            except Exception as exc:
-                logger.error("Shared memory notify error for %s: %s", key, exc)
\ No newline at end of file
+        callbacks = self._subscribers.get(key, ())
+        if len(callbacks) == 1:
+            await self._deliver(key, callbacks[0], entry)
+            return
+        # Run subscribers concurrently; _deliver swallows errors so one failing
+        # callback doesn't cancel the rest of the group.
+        async with asyncio.TaskGroup() as group:
+            for callback in callbacks:
+                group.create_task(self._deliver(key, callback, entry))
+
+    @staticmethod
+    async def _deliver(
+        key: str, callback: SharedMemoryCallback, entry: SharedMemoryEntry
+    ) -> None:
+        try:
+            await callback(entry)
+        except Exception as exc:
+            logger.error("Shared memory notify error for %s: %s", key, exc)
\ No newline at end of file
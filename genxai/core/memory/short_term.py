@@ -1,8 +1,9 @@
 """Short-term memory implementation with LRU eviction."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from datetime import datetime
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from functools import reduce
 import logging
 
 from genxai.core.memory.base import Memory, MemoryType, MemoryConfig
@@ -10,6 +11,11 @@ from genxai.core.memory.base import Memory, MemoryType, MemoryConfig
 logger = logging.getLogger(__name__)
 
 
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
 class ShortTermMemory:
     """Short-term memory with limited capacity and LRU eviction.
     
@@ -30,6 +36,10 @@ class ShortTermMemory:
         # Use OrderedDict for LRU behavior
         self._memories: OrderedDict[str, Memory] = OrderedDict()
         self._access_count = 0
+
+        # Trigram index over lowercased content, used to narrow search() candidates
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        self._memory_trigrams: Dict[str, Set[str]] = {}
         
         logger.info(f"Initialized short-term memory with capacity: {self.capacity}")
 
@@ -44,15 +54,18 @@ class ShortTermMemory:
         # If memory already exists, remove it (will be re-added at end)
         if memory.id in self._memories:
             del self._memories[memory.id]
+            self._unindex(memory.id)
         
         # If at capacity, remove oldest (least recently used)
         if len(self._memories) >= self.capacity:
             oldest_id = next(iter(self._memories))
             evicted = self._memories.pop(oldest_id)
+            self._unindex(oldest_id)
             logger.debug(f"Evicted memory {oldest_id} (importance: {evicted.importance})")
         
         # Add new memory at end (most recently used)
         self._memories[memory.id] = memory
+        self._index(memory)
         logger.debug(f"Stored memory {memory.id} in short-term memory")
 
     def retrieve(self, memory_id: str) -> Optional[Memory]:
@@ -136,20 +149,30 @@ class ShortTermMemory:
             List of matching memories
         """
         query_lower = query.lower()
-        matches = []
-        
-        for memory in self._memories.values():
-            # Convert content to string for searching
-            content_str = str(memory.content).lower()
-            
-            if query_lower in content_str:
-                matches.append(memory)
-        
-        # Sort by recency (most recent first)
-        matches.reverse()
-        
-        # Limit results
-        result = matches[:limit]
+        query_trigrams = _trigrams(query_lower)
+
+        if query_trigrams:
+            # Only memories containing every query trigram can match
+            candidates = reduce(
+                set.intersection,
+                (self._trigram_index.get(t, set()) for t in query_trigrams),
+            )
+        else:
+            # Queries shorter than a trigram can't use the index
+            candidates = set(self._memories)
+
+        result = []
+        remaining = len(candidates)
+        # Walk most recent first so we can stop as soon as the limit is reached
+        for memory_id in reversed(self._memories):
+            if len(result) >= limit or not remaining:
+                break
+            if memory_id not in candidates:
+                continue
+            remaining -= 1
+            memory = self._memories[memory_id]
+            if query_lower in str(memory.content).lower():
+                result.append(memory)
         
         logger.debug(f"Found {len(result)} memories matching '{query}'")
         return result
@@ -165,6 +188,7 @@ class ShortTermMemory:
         """
         if memory_id in self._memories:
             del self._memories[memory_id]
+            self._unindex(memory_id)
             logger.debug(f"Deleted memory {memory_id}")
             return True
         return False
@@ -173,8 +197,25 @@ class ShortTermMemory:
         """Clear all memories."""
         count = len(self._memories)
         self._memories.clear()
+        self._trigram_index.clear()
+        self._memory_trigrams.clear()
         logger.info(f"Cleared {count} memories from short-term memory")
 
+    def _index(self, memory: Memory) -> None:
+        """Add a memory's content trigrams to the search index."""
+        trigrams = _trigrams(str(memory.content).lower())
+        self._memory_trigrams[memory.id] = trigrams
+        for trigram in trigrams:
+            self._trigram_index[trigram].add(memory.id)
+
+    def _unindex(self, memory_id: str) -> None:
+        """Remove a memory from the search index."""
+        for trigram in self._memory_trigrams.pop(memory_id, ()):
+            postings = self._trigram_index[trigram]
+            postings.discard(memory_id)
+            if not postings:
+                del self._trigram_index[trigram]
+
     def get_size(self) -> int:
         """Get current number of stored memories.
 
@@ -291,6 +332,8 @@ class ShortTermMemory:
         """Clear all memories (async version)."""
         count = len(self._memories)
         self._memories.clear()
+        self._trigram_index.clear()
+        self._memory_trigrams.clear()
         logger.info(f"Cleared {count} memories from short-term memory")
     
     @property
@@ -31,9 +31,19 @@ class StateManager:
         self.enable_persistence = enable_persistence
         self.persistence_path = persistence_path or Path(".genxai/state")
         self._state: Dict[str, Any] = {}
+        # True while _state is referenced by a checkpoint; the next write
+        # copies it first (copy-on-write) so checkpoints stay O(1).
+        self._state_shared = False
         self._history: list[Dict[str, Any]] = []
         self._version = 0
 
+    def _writable_state(self) -> Dict[str, Any]:
+        """Return the state dict, copying it first if a checkpoint shares it."""
+        if self._state_shared:
+            self._state = self._state.copy()
+            self._state_shared = False
+        return self._state
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get value from state.
 
@@ -54,7 +64,7 @@ class StateManager:
             value: Value to set
         """
         old_value = self._state.get(key)
-        self._state[key] = value
+        self._writable_state()[key] = value
         self._version += 1
 
         # Record in history
@@ -92,7 +102,7 @@ class StateManager:
         """
         if key in self._state:
             old_value = self._state[key]
-            del self._state[key]
+            del self._writable_state()[key]
             self._version += 1
 
             self._history.append(
@@ -120,7 +130,8 @@ class StateManager:
 
     def clear(self) -> None:
         """Clear all state."""
-        self._state.clear()
+        self._state = {}
+        self._state_shared = False
         self._version += 1
         self._history.append(
             {
@@ -158,8 +169,9 @@ class StateManager:
             "name": name,
             "version": self._version,
             "timestamp": datetime.now().isoformat(),
-            "state": self._state.copy(),
+            "state": self._state,
         }
+        self._state_shared = True
 
         self._history.append(
             {
@@ -191,7 +203,8 @@ class StateManager:
         for entry in reversed(self._history):
             if entry.get("version") == target_version:
                 if entry.get("action") == "checkpoint":
-                    self._state = entry["checkpoint"]["state"].copy()
+                    self._state = entry["checkpoint"]["state"]
+                    self._state_shared = True
                     self._version = target_version
                     logger.info(f"Rolled back to version {target_version}")
                     return
@@ -271,6 +284,7 @@ class StateManager:
             with open(load_path, "r") as f:
                 data = json.load(f)
                 self._state = data.get("state", {})
+                self._state_shared = False
                 self._version = data.get("version", 0)
             logger.info(f"State loaded from {load_path}")
         except Exception as e:
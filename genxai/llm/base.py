@@ -164,8 +164,17 @@ class LLMProvider(ABC):
 
         self._client = None
 
+    def _has_open_resources(self) -> bool:
+        """Whether aclose() has anything to release."""
+        return getattr(self, "_client", None) is not None
+
     def close(self) -> None:
         """Synchronously close any underlying async client resources."""
+        # Nothing to close (e.g. SDK missing or already closed): skip the
+        # event loop lookup and asyncio.run() entirely.
+        if not self._has_open_resources():
+            return
+
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
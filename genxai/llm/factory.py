@@ -1,6 +1,7 @@
 """LLM Provider Factory for creating and managing LLM providers."""
 
 from typing import Optional, Dict, Any, Iterable, List
+import importlib
 import os
 import logging
 
@@ -22,6 +23,8 @@ class LLMProviderFactory:
         "claude-3-haiku",
     ]
 
+    _canonical_providers: tuple[str, ...] = ("openai", "anthropic", "google", "cohere", "ollama")
+
     _providers: Dict[str, type[LLMProvider]] = {
         # OpenAI
         "openai": OpenAIProvider,
@@ -224,7 +227,7 @@ class LLMProviderFactory:
         """
         try:
             module_name, class_name = module_path.rsplit(".", 1)
-            module = __import__(module_name, fromlist=[class_name])
+            module = importlib.import_module(module_name)
             return getattr(module, class_name)
         except Exception as e:
             logger.error(f"Failed to load provider from {module_path}: {e}")
@@ -321,7 +324,7 @@ class LLMProviderFactory:
 
         The unit tests expect these high-level names (not model aliases).
         """
-        return ["openai", "anthropic", "google", "cohere", "ollama"]
+        return list(cls._canonical_providers)
 
     @classmethod
     def supports_model(cls, model: str) -> bool:
@@ -35,6 +35,7 @@ class AnthropicProvider(LLMProvider):
         api_key: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        cache_system_prompt: bool = False,
         **kwargs: Any,
     ) -> None:
         """Initialize Anthropic provider.
@@ -44,11 +45,14 @@ class AnthropicProvider(LLMProvider):
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache_system_prompt: Mark the system prompt for Anthropic prompt
+                caching, so repeated calls with the same prompt reuse it
             **kwargs: Additional Anthropic-specific parameters
         """
         resolved_model = self._normalize_model(model)
         super().__init__(resolved_model, temperature, max_tokens, **kwargs)
         self.requested_model = model
+        self.cache_system_prompt = cache_system_prompt
         
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -72,6 +76,18 @@ class AnthropicProvider(LLMProvider):
             logger.error(f"Failed to initialize Anthropic client: {e}")
             self._client = None
 
+    def _system_param(self, system_prompt: str) -> Any:
+        """Build the ``system`` request parameter for a system prompt."""
+        if not self.cache_system_prompt:
+            return system_prompt
+        return [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     async def generate(
         self,
         prompt: str,
@@ -108,7 +124,7 @@ class AnthropicProvider(LLMProvider):
         
         # Add system prompt if provided
         if system_prompt:
-            params["system"] = system_prompt
+            params["system"] = self._system_param(system_prompt)
 
         # Add additional parameters
         for key in ["top_p", "top_k", "stop_sequences"]:
@@ -213,7 +229,7 @@ class AnthropicProvider(LLMProvider):
         
         # Add system prompt if provided
         if system_prompt:
-            params["system"] = system_prompt
+            params["system"] = self._system_param(system_prompt)
 
         try:
             logger.debug(f"Streaming from Anthropic API with model: {self.model}")
@@ -265,7 +281,7 @@ class AnthropicProvider(LLMProvider):
         }
         
         if system_prompt:
-            params["system"] = system_prompt
+            params["system"] = self._system_param(system_prompt)
 
         try:
             response = await self._client.messages.create(**params)
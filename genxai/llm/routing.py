@@ -30,6 +30,12 @@ class RoutedLLMProvider(LLMProvider):
     def providers(self) -> List[LLMProvider]:
         return [self._primary, *self._fallbacks]
 
+    def _has_open_resources(self) -> bool:
+        return any(
+            not isinstance(provider, LLMProvider) or provider._has_open_resources()
+            for provider in self.providers
+        )
+
     async def aclose(self) -> None:
         """Close all underlying providers."""
         for provider in self.providers:
@@ -4,7 +4,7 @@ import hashlib
 import json
 import pickle
 from typing import Any, Optional, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 import time
 from datetime import timedelta
 
@@ -32,15 +32,16 @@ class CacheBackend:
 class MemoryCache(CacheBackend):
     """In-memory cache backend."""
     
-    def __init__(self):
+    def __init__(self, time_func: Callable[[], float] = time.monotonic):
         self._cache = {}
         self._expiry = {}
+        self._time = time_func
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         # Check expiry
         if key in self._expiry:
-            if time.time() > self._expiry[key]:
+            if self._time() > self._expiry[key]:
                 self.delete(key)
                 return None
         
@@ -51,7 +52,7 @@ class MemoryCache(CacheBackend):
         self._cache[key] = value
         
         if ttl:
-            self._expiry[key] = time.time() + ttl
+            self._expiry[key] = self._time() + ttl
     
     def delete(self, key: str):
         """Delete value from cache."""
@@ -64,6 +65,29 @@ class MemoryCache(CacheBackend):
         self._expiry.clear()
 
 
+# Argument types whose equality matches their JSON encoding. Floats are
+# excluded because 0.0 == -0.0 but they serialize differently.
+_MEMO_KEY_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _build_cache_key(prefix: str, args: tuple, kwargs_items: tuple) -> str:
+    """Hash arguments into a deterministic cache key."""
+    key_data = {
+        "args": args,
+        "kwargs": [list(item) for item in kwargs_items],
+    }
+    key_str = json.dumps(key_data, sort_keys=True)
+    key_hash = hashlib.md5(key_str.encode()).hexdigest()
+    return f"{prefix}:{key_hash}"
+
+
+@lru_cache(maxsize=8192)
+def _memoized_cache_key(
+    prefix: str, args: tuple, kwargs_items: tuple, arg_types: tuple, kwarg_types: tuple
+) -> str:
+    return _build_cache_key(prefix, args, kwargs_items)
+
+
 class RedisCache(CacheBackend):
     """Redis cache backend."""
     
@@ -106,14 +130,19 @@ class CacheManager:
     
     def cache_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate cache key."""
-        # Create deterministic key from arguments
-        key_data = {
-            "args": args,
-            "kwargs": sorted(kwargs.items())
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.md5(key_str.encode()).hexdigest()
-        return f"{prefix}:{key_hash}"
+        kwargs_items = tuple(sorted(kwargs.items()))
+        if all(type(v) in _MEMO_KEY_TYPES for v in args) and all(
+            type(v) in _MEMO_KEY_TYPES for _, v in kwargs_items
+        ):
+            # Types are part of the memo key so 1 and True don't share an entry
+            return _memoized_cache_key(
+                prefix,
+                args,
+                kwargs_items,
+                tuple(type(v) for v in args),
+                tuple(type(v) for _, v in kwargs_items),
+            )
+        return _build_cache_key(prefix, args, kwargs_items)
     
     def get(self, key: str) -> Optional[Any]:
         """Get from cache."""
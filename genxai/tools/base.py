@@ -1,5 +1,6 @@
 """Base tool classes for GenXAI."""
 
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
@@ -84,6 +85,10 @@ class ToolResult(BaseModel):
 class Tool(ABC):
     """Base class for all tools."""
 
+    # Set to True on tools with no shared side effects, so an agent may run
+    # several calls to them from one LLM response concurrently
+    parallel_safe: bool = False
+
     def __init__(self, metadata: ToolMetadata, parameters: List[ToolParameter]):
         """Initialize tool.
 
@@ -353,6 +358,15 @@ class Tool(ABC):
             },
         }
 
+    @cached_property
+    def schema_dict(self) -> Dict[str, Any]:
+        """Schema from :meth:`get_schema`, built once per tool instance.
+
+        Shared by every caller, so treat it as read-only; use
+        :meth:`get_schema` for a dictionary you can modify.
+        """
+        return self.get_schema()
+
     def get_metrics(self) -> Dict[str, Any]:
         """Get tool execution metrics.
 
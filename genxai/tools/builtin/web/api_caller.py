@@ -1,19 +1,28 @@
 """API caller tool for making HTTP requests."""
 
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 import logging
 import json
 
 from genxai.tools.base import Tool, ToolMetadata, ToolParameter, ToolCategory
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
 class APICallerTool(Tool):
     """Make HTTP API calls with authentication support."""
 
-    def __init__(self) -> None:
-        """Initialize API caller tool."""
+    def __init__(self, client: Optional["httpx.AsyncClient"] = None) -> None:
+        """Initialize API caller tool.
+
+        Args:
+            client: Optional shared ``httpx.AsyncClient``. When given, requests
+                reuse its connection pool instead of opening a new client per
+                call; the caller owns and closes it.
+        """
         metadata = ToolMetadata(
             name="api_caller",
             description="Call external REST APIs with various HTTP methods and authentication",
@@ -74,6 +83,7 @@ class APICallerTool(Tool):
         ]
 
         super().__init__(metadata, parameters)
+        self._client = client
 
     async def _execute(
         self,
@@ -130,8 +140,11 @@ class APICallerTool(Tool):
                 request_kwargs["data"] = body
 
         # Make request
-        async with httpx.AsyncClient() as client:
-            response = await client.request(**request_kwargs)
+        if self._client is not None:
+            response = await self._client.request(**request_kwargs)
+        else:
+            async with httpx.AsyncClient() as client:
+                response = await client.request(**request_kwargs)
 
         # Parse response
         result: Dict[str, Any] = {
@@ -1,6 +1,7 @@
 """HTML parser tool for extracting structured data from HTML."""
 
-from typing import Any, Dict, List, Optional
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 from genxai.tools.base import Tool, ToolMetadata, ToolParameter, ToolCategory
@@ -8,6 +9,84 @@ from genxai.tools.base import Tool, ToolMetadata, ToolParameter, ToolCategory
 logger = logging.getLogger(__name__)
 
 
+# Tags whose contents BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "noscript"})
+
+
+class _StreamingHTMLParser(HTMLParser):
+    """Event-driven parser collecting title, text and links without a DOM."""
+
+    def __init__(self, collect_links: bool = True) -> None:
+        super().__init__()
+        self._collect_links = collect_links
+        self._links: List[Tuple[str, List[str]]] = []
+        self._current_href: Optional[str] = None
+        self._current_text: List[str] = []
+        self._text_parts: List[str] = []
+        self._title_parts: List[str] = []
+        self._in_title = False
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in _NON_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == "a" and self._collect_links:
+            # An <a> cannot contain another; an unclosed one ends here
+            self._flush_link()
+            self._current_href = dict(attrs).get("href")
+        elif tag == "title":
+            self._in_title = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _NON_TEXT_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+        elif tag == "a" and self._collect_links:
+            self._flush_link()
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self._title_parts.append(data)
+        if self._skip_depth:
+            return
+        self._text_parts.append(data)
+        if self._current_href is not None:
+            self._current_text.append(data)
+
+    def close(self) -> None:
+        super().close()
+        # Keep a link whose </a> never arrived
+        self._flush_link()
+
+    def _flush_link(self) -> None:
+        if self._current_href:
+            self._links.append((self._current_href, self._current_text))
+        self._current_href = None
+        self._current_text = []
+
+    def title(self) -> Optional[str]:
+        return "".join(self._title_parts).strip() or None
+
+    def text(self, clean_text: bool) -> str:
+        return self._join(self._text_parts, " " if clean_text else None)
+
+    def links(self, clean_text: bool) -> List[Dict[str, Any]]:
+        separator = "" if clean_text else None
+        return [
+            {"href": href, "text": self._join(parts, separator)}
+            for href, parts in self._links
+        ]
+
+    @staticmethod
+    def _join(parts: List[str], separator: Optional[str]) -> str:
+        # Mirrors get_text(): a separator means get_text(separator, strip=True)
+        if separator is None:
+            return "".join(parts)
+        return separator.join(part.strip() for part in parts if part.strip())
+
+
 class HTMLParserTool(Tool):
     """Parse HTML and extract structured data using CSS selectors."""
 
@@ -80,6 +159,8 @@ class HTMLParserTool(Tool):
         Args:
             html: HTML content
             selectors: CSS selectors for extraction
+            extract: Convenience mode, "links" or "text", parsed in one
+                streaming pass without building a DOM
             extract_tables: Extract tables flag
             extract_forms: Extract forms flag
             clean_text: Clean text flag
@@ -87,6 +168,11 @@ class HTMLParserTool(Tool):
         Returns:
             Dictionary containing extracted data
         """
+        # links/text only need one pass over the markup, so stream them
+        # through the stdlib parser instead of building a DOM.
+        if extract in ("links", "text"):
+            return self._extract_streaming(html, extract, clean_text)
+
         # Prefer BeautifulSoup if available, but provide a no-dependency fallback
         # so the framework can function out-of-the-box.
         soup = None
@@ -98,106 +184,22 @@ class HTMLParserTool(Tool):
             soup = None
 
         if soup is None:
-            # Fallback: very small HTML parser using stdlib.
-            from html.parser import HTMLParser
-
-            class _FallbackHTMLParser(HTMLParser):
-                def __init__(self) -> None:
-                    super().__init__()
-                    self.links: list[dict[str, str]] = []
-                    self._current_a_href: Optional[str] = None
-                    self._current_a_text_parts: list[str] = []
-                    self.text_parts: list[str] = []
-                    self.title_parts: list[str] = []
-                    self._in_title = False
-
-                def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
-                    if tag.lower() == "a":
-                        href = None
-                        for k, v in attrs:
-                            if k.lower() == "href":
-                                href = v
-                                break
-                        self._current_a_href = href
-                        self._current_a_text_parts = []
-                    if tag.lower() == "title":
-                        self._in_title = True
-
-                def handle_endtag(self, tag: str) -> None:
-                    if tag.lower() == "a":
-                        if self._current_a_href:
-                            text = "".join(self._current_a_text_parts).strip()
-                            self.links.append({"href": self._current_a_href, "text": text})
-                        self._current_a_href = None
-                        self._current_a_text_parts = []
-                    if tag.lower() == "title":
-                        self._in_title = False
-
-                def handle_data(self, data: str) -> None:
-                    if not data:
-                        return
-                    if self._in_title:
-                        self.title_parts.append(data)
-                    # Accumulate text
-                    self.text_parts.append(data)
-                    # Accumulate current anchor text
-                    if self._current_a_href is not None:
-                        self._current_a_text_parts.append(data)
-
-            parser = _FallbackHTMLParser()
+            parser = _StreamingHTMLParser()
             parser.feed(html)
-
-            result: Dict[str, Any] = {
-                "title": "".join(parser.title_parts).strip() or None,
-            }
-
-            if extract == "links":
-                links = parser.links
-                if clean_text:
-                    for link in links:
-                        link["text"] = " ".join(link.get("text", "").split())
-                result["links"] = links
-                result["links_count"] = len(links)
-                logger.info("HTML parsing (links/fallback) completed successfully")
-                return result
-
-            if extract == "text":
-                text = " ".join("".join(parser.text_parts).split()) if clean_text else "".join(parser.text_parts)
-                result["text"] = text
-                logger.info("HTML parsing (text/fallback) completed successfully")
-                return result
+            parser.close()
 
             # Generic parse response (used by tests: presence of parsed/elements/text)
-            result["parsed"] = True
-            result["text"] = " ".join("".join(parser.text_parts).split()) if clean_text else "".join(parser.text_parts)
-            return result
+            return {
+                "title": parser.title(),
+                "parsed": True,
+                "text": parser.text(clean_text),
+            }
 
         # Parse HTML (BeautifulSoup path)
         result: Dict[str, Any] = {
             "title": soup.title.string if soup.title else None,
         }
 
-        # Convenience extract modes expected by tests
-        if extract == "links":
-            links = []
-            for a in soup.find_all("a"):
-                href = a.get("href")
-                if href:
-                    links.append({
-                        "href": href,
-                        "text": a.get_text(strip=True) if clean_text else a.get_text(),
-                    })
-            result["links"] = links
-            result["links_count"] = len(links)
-            logger.info("HTML parsing (links) completed successfully")
-            return result
-
-        if extract == "text":
-            # Extract all visible text (very lightweight)
-            result["text"] = soup.get_text(" ", strip=True) if clean_text else soup.get_text()
-            logger.info("HTML parsing (text) completed successfully")
-            return result
-
         # Extract data using custom selectors
         if selectors:
             extracted_data = {}
@@ -328,3 +330,20 @@ class HTMLParserTool(Tool):
 
         logger.info("HTML parsing completed successfully")
         return result
+
+    @staticmethod
+    def _extract_streaming(html: str, extract: str, clean_text: bool) -> Dict[str, Any]:
+        """Extract links or text in a single streaming pass."""
+        parser = _StreamingHTMLParser(collect_links=extract == "links")
+        parser.feed(html)
+        parser.close()
+
+        result: Dict[str, Any] = {"title": parser.title()}
+        if extract == "links":
+            result["links"] = parser.links(clean_text)
+            result["links_count"] = len(result["links"])
+        else:
+            result["text"] = parser.text(clean_text)
+
+        logger.info(f"HTML parsing ({extract}) completed successfully")
+        return result
@@ -1,18 +1,29 @@
 """HTTP client tool for advanced HTTP operations."""
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import logging
 
 from genxai.tools.base import Tool, ToolMetadata, ToolParameter, ToolCategory
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
 class HTTPClientTool(Tool):
     """Advanced HTTP client with session management and cookie support."""
 
-    def __init__(self) -> None:
-        """Initialize HTTP client tool."""
+    def __init__(self, client: Optional["httpx.AsyncClient"] = None) -> None:
+        """Initialize HTTP client tool.
+
+        Args:
+            client: Optional shared ``httpx.AsyncClient``. When given, requests
+                reuse its connection pool instead of opening a new client per
+                call; its SSL verification and redirect limit apply (a
+                warning is logged when a call asks for others), and the
+                caller owns and closes it.
+        """
         metadata = ToolMetadata(
             name="http_client",
             description="Advanced HTTP client with session management, cookies, and custom configurations",
@@ -83,6 +94,7 @@ class HTTPClientTool(Tool):
         ]
 
         super().__init__(metadata, parameters)
+        self._client = client
 
     async def _execute(
         self,
@@ -117,26 +129,40 @@ class HTTPClientTool(Tool):
                 "httpx package not installed. Install with: pip install httpx"
             )
 
-        # Prepare client configuration
-        client_kwargs: Dict[str, Any] = {
-            "timeout": timeout,
-            "verify": verify_ssl,
-            "follow_redirects": max_redirects > 0,
-            "max_redirects": max_redirects,
+        request_kwargs: Dict[str, Any] = {
+            "method": method.upper(),
+            "url": url,
+            "headers": headers,
+            "cookies": cookies,
         }
 
         # Add authentication if provided
         if auth and "username" in auth and "password" in auth:
-            client_kwargs["auth"] = (auth["username"], auth["password"])
+            request_kwargs["auth"] = (auth["username"], auth["password"])
 
         # Make request
-        async with httpx.AsyncClient(**client_kwargs) as client:
-            response = await client.request(
-                method=method.upper(),
-                url=url,
-                headers=headers,
-                cookies=cookies,
+        if self._client is not None:
+            if not verify_ssl or max_redirects not in (0, 10):
+                # Both are fixed when an httpx client is built
+                logger.warning(
+                    "HTTP client tool is using a shared client; verify_ssl=%s and "
+                    "max_redirects=%s are ignored in favour of the client's settings",
+                    verify_ssl,
+                    max_redirects,
+                )
+            response = await self._client.request(
+                **request_kwargs,
+                timeout=timeout,
+                follow_redirects=max_redirects > 0,
             )
+        else:
+            async with httpx.AsyncClient(
+                timeout=timeout,
+                verify=verify_ssl,
+                follow_redirects=max_redirects > 0,
+                max_redirects=max_redirects,
+            ) as client:
+                response = await client.request(**request_kwargs)
 
         # Build result
         result: Dict[str, Any] = {
@@ -9,6 +9,13 @@ from genxai.tools.base import Tool, ToolMetadata, ToolParameter, ToolCategory
 
 logger = logging.getLogger(__name__)
 
+# Hostname made of dot-separated labels (no port)
+_DOMAIN_RE = re.compile(
+    r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*"
+    r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$"
+)
+_VALID_SCHEMES = frozenset({"http", "https", "ftp", "ftps"})
+
 
 class URLValidatorTool(Tool):
     """Validate URLs and check their accessibility."""
@@ -83,15 +90,10 @@ class URLValidatorTool(Tool):
             has_netloc = bool(parsed.netloc)
             
             # Validate scheme
-            valid_schemes = ["http", "https", "ftp", "ftps"]
-            scheme_valid = parsed.scheme.lower() in valid_schemes
+            scheme_valid = parsed.scheme.lower() in _VALID_SCHEMES
             
             # Validate domain format
-            domain_pattern = re.compile(
-                r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*"
-                r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$"
-            )
-            domain_valid = bool(domain_pattern.match(parsed.netloc.split(":")[0]))
+            domain_valid = bool(_DOMAIN_RE.match(parsed.netloc.split(":")[0]))
             
             format_valid = has_scheme and has_netloc and scheme_valid and domain_valid
             
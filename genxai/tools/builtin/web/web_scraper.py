@@ -1,20 +1,29 @@
 """Web scraper tool for extracting content from web pages."""
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import logging
 import asyncio
 from urllib.parse import urljoin, urlparse
 
 from genxai.tools.base import Tool, ToolMetadata, ToolParameter, ToolCategory
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
 class WebScraperTool(Tool):
     """Extract content from web pages using BeautifulSoup."""
 
-    def __init__(self) -> None:
-        """Initialize web scraper tool."""
+    def __init__(self, client: Optional["httpx.AsyncClient"] = None) -> None:
+        """Initialize web scraper tool.
+
+        Args:
+            client: Optional shared ``httpx.AsyncClient``. When given, requests
+                reuse its connection pool instead of opening a new client per
+                call; the caller owns and closes it.
+        """
         metadata = ToolMetadata(
             name="web_scraper",
             description="Extract content, text, and links from web pages",
@@ -63,6 +72,7 @@ class WebScraperTool(Tool):
         ]
 
         super().__init__(metadata, parameters)
+        self._client = client
 
     async def _execute(
         self,
@@ -99,10 +109,13 @@ class WebScraperTool(Tool):
             raise ValueError(f"Invalid URL: {url}")
 
         # Fetch page content
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            html_content = response.text
+        if self._client is not None:
+            response = await self._client.get(url, timeout=timeout, follow_redirects=True)
+        else:
+            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+                response = await client.get(url)
+        response.raise_for_status()
+        html_content = response.text
 
         # Parse HTML
         soup = BeautifulSoup(html_content, "html.parser")
@@ -1,19 +1,41 @@
 """Tool registry for managing available tools."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import json
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 from genxai.tools.base import Tool, ToolCategory
 
 logger = logging.getLogger(__name__)
 
 
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 class ToolRegistry:
     """Central registry for all tools."""
 
     SCHEMA_VERSION = "1.0"
     _instance: Optional["ToolRegistry"] = None
     _tools: Dict[str, Tool] = {}
+    # Secondary indexes over _tools, kept in sync by _index/_unindex
+    _by_category: Dict[ToolCategory, Set[str]] = {}
+    _by_tag: Dict[str, Set[str]] = {}
+    # Bumped on every mutation; cached schema bundles are tagged with it
+    _version: int = 0
+    _bundle_cache: Dict[Optional[ToolCategory], Tuple[int, Dict[str, Any]]] = {}
+    _schema_json_cache: Dict[Optional[ToolCategory], Tuple[int, bytes]] = {}
 
     def __new__(cls) -> "ToolRegistry":
         """Singleton pattern for tool registry."""
@@ -21,6 +43,36 @@ class ToolRegistry:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    @classmethod
+    def _index(cls, tool: Tool) -> None:
+        name = tool.metadata.name
+        cls._by_category.setdefault(tool.metadata.category, set()).add(name)
+        for tag in tool.metadata.tags:
+            cls._by_tag.setdefault(tag.lower(), set()).add(name)
+        cls._version += 1
+
+    @classmethod
+    def _unindex(cls, tool: Tool) -> None:
+        name = tool.metadata.name
+        names = cls._by_category.get(tool.metadata.category)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del cls._by_category[tool.metadata.category]
+        for tag in tool.metadata.tags:
+            names = cls._by_tag.get(tag.lower())
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del cls._by_tag[tag.lower()]
+        cls._version += 1
+
+    @classmethod
+    def _tools_in(cls, names: Iterable[str]) -> List[Tool]:
+        """Resolve indexed names to tools, in registration order."""
+        names = set(names)
+        return [tool for name, tool in cls._tools.items() if name in names]
+
     @classmethod
     def register(cls, tool: Tool) -> None:
         """Register a new tool.
@@ -47,9 +99,24 @@ class ToolRegistry:
                 type(tool).__name__,
             )
 
+        if existing is not None:
+            cls._unindex(existing)
         cls._tools[name] = tool
+        cls._index(tool)
         logger.info("Registered tool: %s", name)
 
+    @classmethod
+    def register_many(cls, tools: Iterable[Tool]) -> None:
+        """Register several tools.
+
+        Duplicate handling matches :meth:`register` for each tool.
+
+        Args:
+            tools: Tools to register
+        """
+        for tool in tools:
+            cls.register(tool)
+
     @classmethod
     def unregister(cls, name: str) -> None:
         """Unregister a tool.
@@ -58,7 +125,7 @@ class ToolRegistry:
             name: Tool name to unregister
         """
         if name in cls._tools:
-            del cls._tools[name]
+            cls._unindex(cls._tools.pop(name))
             logger.info(f"Unregistered tool: {name}")
         else:
             logger.warning(f"Tool {name} not found in registry")
@@ -100,11 +167,8 @@ class ToolRegistry:
         results = []
         query_lower = query.lower()
 
-        for tool in cls._tools.values():
-            # Filter by category
-            if category and tool.metadata.category != category:
-                continue
-
+        candidates = cls.get_by_category(category) if category else cls._tools.values()
+        for tool in candidates:
             # Search in name, description, and tags
             if (
                 query_lower in tool.metadata.name.lower()
@@ -123,7 +187,7 @@ class ToolRegistry:
         Returns:
             List of categories
         """
-        return list(set(tool.metadata.category for tool in cls._tools.values()))
+        return list(cls._by_category)
 
     @classmethod
     def get_by_category(cls, category: ToolCategory) -> List[Tool]:
@@ -135,9 +199,7 @@ class ToolRegistry:
         Returns:
             List of tools in category
         """
-        return [
-            tool for tool in cls._tools.values() if tool.metadata.category == category
-        ]
+        return cls._tools_in(cls._by_category.get(category, ()))
 
     @classmethod
     def get_by_tag(cls, tag: str) -> List[Tool]:
@@ -149,16 +211,30 @@ class ToolRegistry:
         Returns:
             List of tools with tag
         """
-        return [
-            tool
-            for tool in cls._tools.values()
-            if tag.lower() in [t.lower() for t in tool.metadata.tags]
-        ]
+        return cls._tools_in(cls._by_tag.get(tag.lower(), ()))
+
+    @classmethod
+    def restore(cls, tools: Iterable[Tool]) -> None:
+        """Replace the registry contents, e.g. with an earlier ``list_all()``.
+
+        Args:
+            tools: Tools the registry should hold afterwards
+        """
+        cls._tools.clear()
+        cls._by_category.clear()
+        cls._by_tag.clear()
+        cls._version += 1
+        for tool in tools:
+            cls._tools[tool.metadata.name] = tool
+            cls._index(tool)
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered tools."""
         cls._tools.clear()
+        cls._by_category.clear()
+        cls._by_tag.clear()
+        cls._version += 1
         logger.info("Cleared all tools from registry")
 
     @classmethod
@@ -168,23 +244,28 @@ class ToolRegistry:
         Returns:
             Dictionary containing tool schemas and metadata.
         """
-        tools = [
-            tool.get_schema()
-            for tool in cls._tools.values()
-            if not category or tool.metadata.category == category
-        ]
-        categories = {}
-        for tool in cls._tools.values():
-            if category and tool.metadata.category != category:
-                continue
-            category = tool.metadata.category.value
-            categories[category] = categories.get(category, 0) + 1
+        cached = cls._bundle_cache.get(category)
+        if cached is None or cached[0] != cls._version:
+            selected = cls.get_by_category(category) if category else list(cls._tools.values())
+            categories: Dict[str, int] = {}
+            for tool in selected:
+                value = tool.metadata.category.value
+                categories[value] = categories.get(value, 0) + 1
+            bundle = {
+                "schema_version": cls.SCHEMA_VERSION,
+                "tool_count": len(selected),
+                "categories": categories,
+                "tools": [tool.schema_dict for tool in selected],
+            }
+            cls._bundle_cache[category] = (cls._version, bundle)
+        else:
+            bundle = cached[1]
 
+        # Fresh containers so callers can't mutate the cached bundle
         return {
-            "schema_version": cls.SCHEMA_VERSION,
-            "tool_count": len(tools),
-            "categories": categories,
-            "tools": tools,
+            **bundle,
+            "categories": dict(bundle["categories"]),
+            "tools": list(bundle["tools"]),
         }
 
     @classmethod
@@ -212,13 +293,24 @@ class ToolRegistry:
                 raise ImportError(
                     "PyYAML is required for YAML output. Install with: pip install PyYAML"
                 ) from exc
-            output_path.write_text(yaml.safe_dump(bundle, sort_keys=False))
+            # libyaml's C dumper when available; same output as safe_dump
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            output_path.write_text(yaml.dump(bundle, Dumper=dumper, sort_keys=False))
         else:
-            import json
-
-            output_path.write_text(json.dumps(bundle, indent=2))
+            output_path.write_bytes(cls._schema_json(category, bundle))
         return str(output_path.resolve())
 
+    @classmethod
+    def _schema_json(cls, category: Optional[ToolCategory], bundle: Dict[str, Any]) -> bytes:
+        """Serialize a schema bundle, reusing the bytes until the registry changes."""
+        cached = cls._schema_json_cache.get(category)
+        if cached is not None and cached[0] == cls._version:
+            return cached[1]
+
+        payload = _dump_json(bundle)
+        cls._schema_json_cache[category] = (cls._version, payload)
+        return payload
+
     @classmethod
     def get_stats(cls) -> Dict[str, any]:
         """Get registry statistics.
@@ -1,13 +1,40 @@
 """Tool templates for quick tool creation."""
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
+import csv
+import io
+import json
 import logging
+import re
 import httpx
 from genxai.tools.base import Tool, ToolMetadata, ToolParameter, ToolCategory
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+# orjson reads integers beyond 64 bits as lossy floats, so text with a run of
+# 19+ digits (the shortest that can overflow, even inside a string) goes to json
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+
+
+def _load_json(raw: str) -> Any:
+    """Parse JSON text, using orjson when it reads the same values as json."""
+    if ORJSON_AVAILABLE and not _LONG_DIGITS_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity tokens, which json accepts
+            pass
+    return json.loads(raw)
+
+
 # Template definitions
 TEMPLATES = {
     "api_call": {
@@ -138,6 +165,16 @@ class APICallTool(Tool):
             raise RuntimeError(f"API call failed: {e}")
 
 
+# Text operations, built once rather than per call
+_TEXT_OPERATIONS: Dict[str, Callable[[str], Any]] = {
+    "uppercase": str.upper,
+    "lowercase": str.lower,
+    "reverse": lambda t: t[::-1],
+    "word_count": lambda t: len(t.split()),
+    "char_count": len,
+}
+
+
 class TextProcessorTool(Tool):
     """Template tool for text processing."""
 
@@ -176,23 +213,20 @@ class TextProcessorTool(Tool):
         super().__init__(metadata, parameters)
         self.config = config
         self.default_operation = config.get("operation", "uppercase")
+        if self.default_operation not in _TEXT_OPERATIONS:
+            raise ValueError(f"Unknown operation: {self.default_operation}")
+        self._default_fn = _TEXT_OPERATIONS[self.default_operation]
 
     async def _execute(self, text: str, operation: str = None, **kwargs: Any) -> Any:
         """Execute text processing."""
-        op = operation or self.default_operation
-
-        operations = {
-            "uppercase": lambda t: t.upper(),
-            "lowercase": lambda t: t.lower(),
-            "reverse": lambda t: t[::-1],
-            "word_count": lambda t: len(t.split()),
-            "char_count": lambda t: len(t),
-        }
-
-        if op not in operations:
-            raise ValueError(f"Unknown operation: {op}")
+        if operation is None or operation == self.default_operation:
+            op, fn = self.default_operation, self._default_fn
+        else:
+            op, fn = operation, _TEXT_OPERATIONS.get(operation)
+            if fn is None:
+                raise ValueError(f"Unknown operation: {op}")
 
-        result = operations[op](text)
+        result = fn(text)
 
         return {
             "operation": op,
@@ -256,16 +290,12 @@ class DataTransformerTool(Tool):
         **kwargs: Any
     ) -> Any:
         """Execute data transformation."""
-        import json
-        import csv
-        import io
-
         from_fmt = from_format or self.default_from
         to_fmt = to_format or self.default_to
 
         # Parse input
         if from_fmt == "json":
-            parsed_data = json.loads(data)
+            parsed_data = _load_json(data)
         elif from_fmt == "csv":
             reader = csv.DictReader(io.StringIO(data))
             parsed_data = list(reader)
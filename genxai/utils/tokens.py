@@ -1,13 +1,28 @@
 """Token counting and context window management utilities."""
 
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 import logging
+import threading
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None  # type: ignore
+    TIKTOKEN_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Rough estimate used when no tokenizer is available: ~4 characters per
+# token for English text.
+CHARS_PER_TOKEN = 4
+
 
 # Model token limits (context window sizes)
-MODEL_TOKEN_LIMITS: Dict[str, int] = {
+MODEL_TOKEN_LIMITS: Mapping[str, int] = MappingProxyType({
     # OpenAI models
     "gpt-4": 8192,
     "gpt-4-32k": 32768,
@@ -35,7 +50,13 @@ MODEL_TOKEN_LIMITS: Dict[str, int] = {
     "command": 4096,
     "command-light": 4096,
     "command-nightly": 8192,
-}
+})
+
+# Longest prefixes first, so "gpt-4-turbo-2024-04-09" matches "gpt-4-turbo"
+# rather than "gpt-4"
+_MODEL_LIMIT_PREFIXES: Tuple[Tuple[str, int], ...] = tuple(
+    sorted(MODEL_TOKEN_LIMITS.items(), key=lambda item: -len(item[0]))
+)
 
 
 def get_model_token_limit(model: str) -> int:
@@ -48,11 +69,12 @@ def get_model_token_limit(model: str) -> int:
         Token limit for the model, or 4096 as default
     """
     # Try exact match first
-    if model in MODEL_TOKEN_LIMITS:
-        return MODEL_TOKEN_LIMITS[model]
+    limit = MODEL_TOKEN_LIMITS.get(model)
+    if limit is not None:
+        return limit
     
     # Try partial match (e.g., "gpt-4-0125-preview" matches "gpt-4")
-    for model_prefix, limit in MODEL_TOKEN_LIMITS.items():
+    for model_prefix, limit in _MODEL_LIMIT_PREFIXES:
         if model.startswith(model_prefix):
             return limit
     
@@ -61,27 +83,68 @@ def get_model_token_limit(model: str) -> int:
     return 4096
 
 
-def estimate_tokens(text: str) -> int:
+@lru_cache(maxsize=32)
+def _get_encoding(model: Optional[str] = None) -> Optional[Any]:
+    """Load (once per process) the tiktoken encoding for a model.
+
+    The first call for an encoding reads its BPE file from tiktoken's cache
+    directory, downloading it if needed, and blocks while doing so. When that
+    fails (e.g. offline without a pre-populated ``TIKTOKEN_CACHE_DIR``) the
+    None result is cached too, so callers use the character estimate for the
+    rest of the process instead of retrying the download on every call.
+
+    Args:
+        model: Model name, or None for the default encoding
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken is unavailable or the encoding
+        could not be loaded
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        if model:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                pass
+        # Non-OpenAI models: cl100k_base is a reasonable approximation
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # e.g. BPE files can't be downloaded in an offline environment
+        logger.warning(f"Could not load tiktoken encoding, using character estimate: {e}")
+        return None
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
     """Estimate token count for text.
 
-    This is a simple estimation based on character count.
-    For production use, consider using tiktoken library for accurate counting.
+    Uses tiktoken when it is installed, otherwise falls back to a
+    character-based estimate.
 
     Args:
         text: Text to estimate tokens for
+        model: Optional model name used to pick the tokenizer
 
     Returns:
         Estimated token count
     """
-    # Rough estimation: ~4 characters per token for English text
-    # This is conservative and works reasonably well for most cases
-    return len(text) // 4
+    if not text:
+        return 0
+
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    # Conservative and works reasonably well for most English text
+    return len(text) // CHARS_PER_TOKEN
 
 
 def truncate_to_token_limit(
     text: str,
     max_tokens: int,
     preserve_start: bool = True,
+    model: Optional[str] = None,
 ) -> str:
     """Truncate text to fit within token limit.
 
@@ -89,26 +152,46 @@ def truncate_to_token_limit(
         text: Text to truncate
         max_tokens: Maximum tokens allowed
         preserve_start: If True, keep start of text; if False, keep end
+        model: Optional model name used to pick the tokenizer
 
     Returns:
         Truncated text
     """
-    estimated_tokens = estimate_tokens(text)
-    
-    if estimated_tokens <= max_tokens:
+    if max_tokens > 0 and estimate_tokens(text, model) <= max_tokens:
         return text
     
-    # Calculate how many characters to keep
-    # Using 4 chars per token estimation
-    max_chars = max_tokens * 4
-    
-    if preserve_start:
-        truncated = text[:max_chars]
-        logger.debug(f"Truncated text from {len(text)} to {len(truncated)} chars (start preserved)")
+    return _slice_to_tokens(text, max_tokens, preserve_start, model)
+
+
+def _slice_to_tokens(
+    text: str,
+    max_tokens: int,
+    preserve_start: bool,
+    model: Optional[str] = None,
+) -> str:
+    """Slice text known to exceed max_tokens down to max_tokens tokens.
+
+    Slices the encoded tokens when a tokenizer is available, so the result
+    matches what estimate_tokens counts; otherwise slices by characters.
+    """
+    if max_tokens <= 0:
+        # text[-0:] would keep everything
+        return ""
+
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        token_ids = encoding.encode(text, disallowed_special=())
+        kept = token_ids[:max_tokens] if preserve_start else token_ids[-max_tokens:]
+        truncated = encoding.decode(kept)
     else:
-        truncated = text[-max_chars:]
-        logger.debug(f"Truncated text from {len(text)} to {len(truncated)} chars (end preserved)")
-    
+        # Calculate how many characters to keep
+        max_chars = max_tokens * CHARS_PER_TOKEN
+        truncated = text[:max_chars] if preserve_start else text[-max_chars:]
+
+    logger.debug(
+        f"Truncated text from {len(text)} to {len(truncated)} chars "
+        f"({'start' if preserve_start else 'end'} preserved)"
+    )
     return truncated
 
 
@@ -135,9 +218,9 @@ def manage_context_window(
     available_tokens = model_limit - reserve_tokens
     
     # Estimate current token usage
-    system_tokens = estimate_tokens(system_prompt)
-    user_tokens = estimate_tokens(user_prompt)
-    memory_tokens = estimate_tokens(memory_context)
+    system_tokens = estimate_tokens(system_prompt, model)
+    user_tokens = estimate_tokens(user_prompt, model)
+    memory_tokens = estimate_tokens(memory_context, model)
     total_tokens = system_tokens + user_tokens + memory_tokens
     
     logger.debug(
@@ -156,14 +239,18 @@ def manage_context_window(
         f"Context window exceeded by {tokens_to_remove} tokens, truncating..."
     )
     
+    # Each tier below is sliced straight to its new budget: its token count is
+    # already known, so there's no need to re-estimate it.
+
     # First, try truncating memory context
     if memory_tokens > 0 and tokens_to_remove > 0:
         memory_reduction = min(memory_tokens, tokens_to_remove)
         new_memory_tokens = max(0, memory_tokens - memory_reduction)
-        memory_context = truncate_to_token_limit(
+        memory_context = _slice_to_tokens(
             memory_context,
             new_memory_tokens,
-            preserve_start=False  # Keep most recent memories
+            preserve_start=False,  # Keep most recent memories
+            model=model,
         )
         tokens_to_remove -= memory_reduction
         logger.debug(f"Truncated memory context by {memory_reduction} tokens")
@@ -172,21 +259,23 @@ def manage_context_window(
     if tokens_to_remove > 0 and system_tokens > 500:  # Keep at least 500 tokens
         system_reduction = min(system_tokens - 500, tokens_to_remove)
         new_system_tokens = max(500, system_tokens - system_reduction)
-        system_prompt = truncate_to_token_limit(
+        system_prompt = _slice_to_tokens(
             system_prompt,
             new_system_tokens,
-            preserve_start=True  # Keep role/goal at start
+            preserve_start=True,  # Keep role/goal at start
+            model=model,
         )
         tokens_to_remove -= system_reduction
         logger.debug(f"Truncated system prompt by {system_reduction} tokens")
     
     # If still over limit, truncate user prompt (last resort)
-    if tokens_to_remove > 0 and user_tokens > 0:
+    if tokens_to_remove > 0 and user_tokens > 100:
         new_user_tokens = max(100, user_tokens - tokens_to_remove)  # Keep at least 100 tokens
-        user_prompt = truncate_to_token_limit(
+        user_prompt = _slice_to_tokens(
             user_prompt,
             new_user_tokens,
-            preserve_start=True  # Keep task description
+            preserve_start=True,  # Keep task description
+            model=model,
         )
         logger.warning(f"Had to truncate user prompt by {tokens_to_remove} tokens")
     
@@ -197,6 +286,7 @@ def split_text_by_tokens(
     text: str,
     max_tokens_per_chunk: int,
     overlap_tokens: int = 100,
+    model: Optional[str] = None,
 ) -> List[str]:
     """Split text into chunks by token count.
 
@@ -204,37 +294,68 @@ def split_text_by_tokens(
         text: Text to split
         max_tokens_per_chunk: Maximum tokens per chunk
         overlap_tokens: Number of tokens to overlap between chunks
+        model: Optional model name used to pick the tokenizer
 
     Returns:
         List of text chunks
+
+    Raises:
+        ValueError: If the text needs splitting and overlap_tokens is not
+            smaller than max_tokens_per_chunk
     """
-    estimated_total_tokens = estimate_tokens(text)
-    
-    if estimated_total_tokens <= max_tokens_per_chunk:
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        token_ids = encoding.encode(text, disallowed_special=())
+        total_tokens = len(token_ids)
+    else:
+        total_tokens = len(text) // CHARS_PER_TOKEN
+
+    if total_tokens <= max_tokens_per_chunk:
         return [text]
-    
-    chunks = []
-    chars_per_chunk = max_tokens_per_chunk * 4  # 4 chars per token
-    overlap_chars = overlap_tokens * 4
-    
-    start = 0
-    while start < len(text):
-        end = start + chars_per_chunk
-        chunk = text[start:end]
-        chunks.append(chunk)
-        
-        # Move start forward, accounting for overlap
-        start = end - overlap_chars
-        
-        if start >= len(text):
-            break
-    
+
+    if overlap_tokens >= max_tokens_per_chunk:
+        raise ValueError(
+            f"overlap_tokens ({overlap_tokens}) must be smaller than "
+            f"max_tokens_per_chunk ({max_tokens_per_chunk})"
+        )
+    # Each chunk starts overlap_tokens before the previous one ended
+    step = max_tokens_per_chunk - overlap_tokens
+
+    if encoding is not None:
+        chunks = [
+            encoding.decode(token_ids[start:start + max_tokens_per_chunk])
+            for start in range(0, total_tokens, step)
+        ]
+    else:
+        chars_per_chunk = max_tokens_per_chunk * CHARS_PER_TOKEN
+        chunks = [
+            text[start:start + chars_per_chunk]
+            for start in range(0, len(text), step * CHARS_PER_TOKEN)
+        ]
+
     logger.debug(f"Split text into {len(chunks)} chunks")
     return chunks
 
 
 class TokenCounter:
-    """Token counter with caching for efficiency."""
+    """Token counter with caching for efficiency.
+
+    Counters are shared per model: constructing ``TokenCounter(model)`` again
+    returns the existing instance, so its token cache is reused. That cache is
+    shared by every caller using the model, so :meth:`clear_cache` clears it
+    for all of them. Cache access is guarded by a lock, so one counter can be
+    used from several threads.
+    """
+
+    _instances: Dict[Tuple[type, str], "TokenCounter"] = {}
+    # Per-counter LRU bound on cached token counts
+    CACHE_MAX_SIZE = 4096
+
+    def __new__(cls, model: str) -> "TokenCounter":
+        instance = cls._instances.get((cls, model))
+        if instance is None:
+            instance = cls._instances.setdefault((cls, model), super().__new__(cls))
+        return instance
 
     def __init__(self, model: str):
         """Initialize token counter.
@@ -242,9 +363,13 @@ class TokenCounter:
         Args:
             model: Model name for token limit
         """
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
         self.model = model
         self.token_limit = get_model_token_limit(model)
-        self._cache: Dict[str, int] = {}
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
 
     def count(self, text: str, use_cache: bool = True) -> int:
         """Count tokens in text.
@@ -256,16 +381,62 @@ class TokenCounter:
         Returns:
             Token count
         """
-        if use_cache and text in self._cache:
-            return self._cache[text]
+        if use_cache:
+            with self._lock:
+                cached = self._cache.get(text)
+                if cached is not None:
+                    self._cache.move_to_end(text)
+                    return cached
         
-        count = estimate_tokens(text)
+        count = estimate_tokens(text, self.model)
         
         if use_cache:
-            self._cache[text] = count
+            with self._lock:
+                self._cache[text] = count
+                self._evict()
         
         return count
 
+    def count_many(self, texts: Iterable[str], use_cache: bool = True) -> List[int]:
+        """Count tokens for several texts at once.
+
+        Uncached texts are encoded in a single tiktoken batch call when a
+        tokenizer is available.
+
+        Args:
+            texts: Texts to count tokens for
+            use_cache: Whether to use cache
+
+        Returns:
+            Token counts, in the same order as texts
+        """
+        texts = list(texts)
+        unique = dict.fromkeys(texts)
+        known: Dict[str, int] = {}
+        if use_cache:
+            with self._lock:
+                known = {text: self._cache[text] for text in unique if text in self._cache}
+        pending = [text for text in unique if text not in known]
+
+        # Encoding happens outside the lock, so other threads aren't held up
+        encoding = _get_encoding(self.model) if len(pending) > 1 else None
+        if encoding is not None:
+            encoded = encoding.encode_ordinary_batch(pending)
+            counts = {text: len(tokens) for text, tokens in zip(pending, encoded, strict=True)}
+        else:
+            counts = {text: estimate_tokens(text, self.model) for text in pending}
+
+        results = [counts[text] if text in counts else known[text] for text in texts]
+        if use_cache:
+            with self._lock:
+                for text in known:
+                    # May have been evicted by another thread meanwhile
+                    if text in self._cache:
+                        self._cache.move_to_end(text)
+                self._cache.update(counts)
+                self._evict()
+        return results
+
     def fits_in_context(
         self,
         *texts: str,
@@ -280,13 +451,30 @@ class TokenCounter:
         Returns:
             True if texts fit in context window
         """
-        total_tokens = sum(self.count(text) for text in texts)
         available_tokens = self.token_limit - reserve_tokens
-        return total_tokens <= available_tokens
+        total_tokens = 0
+        for text in texts:
+            total_tokens += self.count(text)
+            # Stop before counting the rest once the budget is blown
+            if total_tokens > available_tokens:
+                return False
+        return True
+
+    def _evict(self) -> None:
+        """Drop least recently used counts beyond CACHE_MAX_SIZE.
+
+        Callers must hold ``self._lock``.
+        """
+        while len(self._cache) > self.CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
 
     def clear_cache(self) -> None:
-        """Clear token count cache."""
-        self._cache.clear()
+        """Clear token count cache.
+
+        The cache is shared by every ``TokenCounter`` for this model.
+        """
+        with self._lock:
+            self._cache.clear()
 
     def get_stats(self) -> Dict[str, any]:
         """Get counter statistics.
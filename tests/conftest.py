@@ -1,10 +1,15 @@
 """Global test configuration."""
 
+import importlib
 import os
 import warnings
 
 import pytest
 
+from genxai.core.agent.registry import AgentRegistry
+from genxai.tools.registry import ToolRegistry
+from tests.utils.mock_llm import MockLLMProvider
+
 
 warnings.filterwarnings(
     "ignore",
@@ -12,6 +17,91 @@ warnings.filterwarnings(
     message=r"unclosed database in <sqlite3\.Connection",
 )
 
+_PROVIDER_MODULES = (
+    "genxai.llm.providers.openai",
+    "genxai.llm.providers.anthropic",
+    "genxai.llm.providers.google",
+    "genxai.llm.providers.cohere",
+    "genxai.llm.providers.ollama",
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--preload-providers",
+        action="store_true",
+        default=False,
+        help="Import all LLM provider modules once at session start.",
+    )
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="Run tests marked 'network' that reach real hosts or DNS.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_providers(request):
+    """Warm provider imports so the first provider test doesn't pay for them.
+
+    Off by default so selecting a single provider's tests only imports that
+    provider. Each xdist worker runs this once when enabled.
+    """
+    if not request.config.getoption("--preload-providers"):
+        return
+    for module_name in _PROVIDER_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            # Optional SDKs may be missing; those tests skip or fail on their own.
+            pass
+
+
+@pytest.fixture(autouse=True)
+def _isolate_agent_registry():
+    """Undo any AgentRegistry changes a test makes to the global registry."""
+    snapshot = AgentRegistry.get_all()
+    yield
+    AgentRegistry.restore(snapshot)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_tool_registry():
+    """Undo any ToolRegistry changes a test makes to the global registry."""
+    snapshot = ToolRegistry.list_all()
+    yield
+    ToolRegistry.restore(snapshot)
+
+
+@pytest.fixture(scope="session")
+def httpbin_url():
+    """Base URL for network tests that need a real httpbin.
+
+    Set GENXAI_TEST_HTTPBIN_URL to a local instance (for example
+    ``docker run -p 8080:80 kennethreitz/httpbin``) to avoid WAN round trips.
+    """
+    return os.environ.get("GENXAI_TEST_HTTPBIN_URL", "https://httpbin.org").rstrip("/")
+
+
+@pytest.fixture(scope="session")
+def mock_llm():
+    """One deterministic mock provider shared by the whole session.
+
+    It only keeps usage counters, so sharing it across tests is safe; call
+    ``reset_stats()`` before asserting on them.
+    """
+    return MockLLMProvider()
+
 
 #@pytest.fixture(autouse=True)
 #def reset_audit_services(tmp_path, monkeypatch):
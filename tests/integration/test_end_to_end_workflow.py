@@ -9,6 +9,13 @@ from genxai.core.agent.base import AgentFactory
 from genxai.core.agent.runtime import AgentRuntime
 from genxai.tools.registry import ToolRegistry
 from genxai.tools.builtin import *
+from genxai.tools.builtin.computation.calculator import CalculatorTool
+
+
+@pytest.fixture(autouse=True)
+def builtin_tools():
+    """Re-register builtins that another module may have cleared."""
+    ToolRegistry.register(CalculatorTool())
 
 
 @pytest.mark.integration
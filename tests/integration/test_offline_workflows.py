@@ -142,8 +142,7 @@ async def test_offline_branching_workflow():
         goal="Handle branch B",
         llm_model="stub",
     )
-    AgentRegistry.register(agent_a)
-    AgentRegistry.register(agent_b)
+    AgentRegistry.register_many([agent_a, agent_b])
 
     graph = Graph(name="offline_branching")
     graph.add_node(InputNode())
@@ -177,8 +176,7 @@ async def test_offline_parallel_workflow():
         goal="Handle parallel work",
         llm_model="stub",
     )
-    AgentRegistry.register(agent_1)
-    AgentRegistry.register(agent_2)
+    AgentRegistry.register_many([agent_1, agent_2])
 
     graph = Graph(name="offline_parallel")
     graph.add_node(InputNode())
@@ -239,8 +237,7 @@ async def test_offline_edge_priority_ordering():
         goal="Run second",
         llm_model="stub",
     )
-    AgentRegistry.register(first_agent)
-    AgentRegistry.register(second_agent)
+    AgentRegistry.register_many([first_agent, second_agent])
 
     graph = Graph(name="offline_priority")
     graph.add_node(InputNode())
@@ -274,8 +271,7 @@ async def test_offline_conditional_metadata_parallel():
         goal="Run when blocked",
         llm_model="stub",
     )
-    AgentRegistry.register(allowed_agent)
-    AgentRegistry.register(blocked_agent)
+    AgentRegistry.register_many([allowed_agent, blocked_agent])
 
     graph = Graph(name="offline_conditional_parallel")
     graph.add_node(InputNode())
@@ -0,0 +1,19 @@
+"""Unit test fixtures."""
+
+import httpx
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_session():
+    """One keep-alive httpx client shared by the network-bound web tool tests.
+
+    It lives on the session event loop, so tests using it must run there too
+    (``@pytest.mark.asyncio(loop_scope="session")``).
+    """
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=10.0,
+    )
+    yield client
+    await client.aclose()
@@ -22,6 +22,22 @@ def test_agent_registry_register():
     AgentRegistry.clear()
 
 
+def test_agent_registry_register_many():
+    """Test registering several agents at once."""
+    AgentRegistry.clear()
+
+    agents = [
+        AgentFactory.create_agent(id=f"agent_{i}", role="Test", goal="Test", llm_model="gpt-4")
+        for i in range(3)
+    ]
+
+    AgentRegistry.register_many(agents)
+
+    assert AgentRegistry.list_all() == ["agent_0", "agent_1", "agent_2"]
+    assert AgentRegistry.get("agent_1") is agents[1]
+    AgentRegistry.clear()
+
+
 def test_agent_registry_get():
     """Test getting an agent from registry."""
     AgentRegistry.clear()
@@ -84,3 +100,20 @@ def test_agent_registry_unregister():
     AgentRegistry.unregister("test")
     assert AgentRegistry.get("test") is None
     AgentRegistry.clear()
+
+
+def test_agent_registry_restore():
+    """Test restoring a registry snapshot."""
+    AgentRegistry.clear()
+    kept = AgentFactory.create_agent(id="kept", role="Test", goal="Test", llm_model="gpt-4")
+    AgentRegistry.register(kept)
+    snapshot = AgentRegistry.get_all()
+
+    AgentRegistry.register(
+        AgentFactory.create_agent(id="extra", role="Test", goal="Test", llm_model="gpt-4")
+    )
+    AgentRegistry.unregister("kept")
+
+    AgentRegistry.restore(snapshot)
+    assert AgentRegistry.list_all() == ["kept"]
+    AgentRegistry.clear()
@@ -341,6 +341,15 @@ def test_build_system_prompt(runtime):
     assert "Test backstory" in system_prompt
 
 
+def test_build_system_prompt_is_reused_until_config_changes(runtime):
+    """Test the system prompt is cached and rebuilt after config edits."""
+    first = runtime._build_system_prompt()
+    assert runtime._build_system_prompt() is first
+
+    runtime.agent.config.goal = "New goal"
+    assert "New goal" in runtime._build_system_prompt()
+
+
 def test_build_prompt_agent_types():
     """Test agent-type specific instructions."""
     # Test deliberative agent
@@ -75,6 +75,7 @@ async def test_slack_notifier_invalid_webhook():
     assert result.error is not None
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
 async def test_slack_notifier_empty_message():
     """Test Slack notifier with empty message."""
@@ -165,6 +166,7 @@ async def test_webhook_caller_invalid_url():
     assert result.error is not None
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
 async def test_webhook_caller_nonexistent_url():
     """Test webhook caller with nonexistent URL."""
@@ -176,12 +178,13 @@ async def test_webhook_caller_nonexistent_url():
     assert result.success is False
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
-async def test_webhook_caller_empty_payload():
+async def test_webhook_caller_empty_payload(httpbin_url):
     """Test webhook caller with empty payload."""
     tool = WebhookCallerTool()
     result = await tool.execute(
-        url="https://httpbin.org/post",
+        url=f"{httpbin_url}/post",
         payload={}
     )
     # Should succeed with empty payload
@@ -37,6 +37,24 @@ class MockLLMProvider(LLMProvider):
         yield "response"
 
 
+@pytest.fixture(scope="module")
+def mock_agent_pair():
+    """Build the two conditional-edge agents once per module."""
+    agent1 = AgentFactory.create_agent(
+        id="test_agent",
+        role="Agent 1",
+        goal="Test conditional edge",
+        llm_model="mock-model",
+    )
+    agent2 = AgentFactory.create_agent(
+        id="test_agent2",
+        role="Agent 2",
+        goal="Test conditional edge",
+        llm_model="mock-model",
+    )
+    return agent1, agent2
+
+
 class TestNode:
     """Tests for Node class."""
 
@@ -170,6 +188,12 @@ class TestGraph:
         with pytest.raises(GraphExecutionError, match="at least one node"):
             graph.validate()
 
+    def test_single_node_graph_validation(self) -> None:
+        """Test that a lone node without edges is valid."""
+        graph = Graph()
+        graph.add_node(InputNode())
+        assert graph.validate() is True
+
     def test_get_outgoing_edges(self) -> None:
         """Test getting outgoing edges."""
         graph = Graph()
@@ -206,6 +230,19 @@ class TestGraph:
         assert "input" in incoming
         assert "agent1" in incoming
 
+    def test_get_incoming_nodes_deduplicates_parallel_edges(self) -> None:
+        """Test that repeated edges between two nodes report the source once."""
+        graph = Graph()
+        graph.add_node(InputNode())
+        graph.add_node(OutputNode())
+
+        graph.add_edge(Edge(source="input", target="output"))
+        graph.add_edge(Edge(source="input", target="output", priority=1))
+
+        assert graph.get_incoming_nodes("output") == ["input"]
+        assert len(graph.get_outgoing_edges("input")) == 2
+        assert graph.topological_sort() == ["input", "output"]
+
     def test_topological_sort(self) -> None:
         """Test topological sort."""
         graph = Graph()
@@ -225,6 +262,18 @@ class TestGraph:
         assert sorted_nodes.index("input") < sorted_nodes.index("agent1")
         assert sorted_nodes.index("agent1") < sorted_nodes.index("output")
 
+    def test_topological_sort_with_cycle(self) -> None:
+        """Test that topological sort rejects cyclic graphs."""
+        graph = Graph()
+        graph.add_node(InputNode())
+        graph.add_node(OutputNode())
+
+        graph.add_edge(Edge(source="input", target="output"))
+        graph.add_edge(Edge(source="output", target="input"))
+
+        with pytest.raises(GraphExecutionError, match="cycles"):
+            graph.topological_sort()
+
     def test_to_dict(self) -> None:
         """Test graph serialization to dict."""
         graph = Graph(name="test_graph")
@@ -256,22 +305,9 @@ class TestGraph:
         assert result["input"] == "test_input"
 
     @pytest.mark.asyncio
-    async def test_conditional_edge_execution(self) -> None:
+    async def test_conditional_edge_execution(self, mock_agent_pair) -> None:
         """Test graph execution with conditional edges."""
-        agent1 = AgentFactory.create_agent(
-            id="test_agent",
-            role="Agent 1",
-            goal="Test conditional edge",
-            llm_model="mock-model",
-        )
-        agent2 = AgentFactory.create_agent(
-            id="test_agent2",
-            role="Agent 2",
-            goal="Test conditional edge",
-            llm_model="mock-model",
-        )
-        AgentRegistry.register(agent1)
-        AgentRegistry.register(agent2)
+        AgentRegistry.register_many(mock_agent_pair)
 
         graph = Graph(name="conditional_test")
         node1 = InputNode()
@@ -1,7 +1,14 @@
 """Tests for graph executor."""
 
+import asyncio
+
 import pytest
-from genxai.core.graph.executor import WorkflowExecutor, EnhancedGraph, execute_workflow_sync
+from genxai.core.graph.executor import (
+    ExecutionResult,
+    WorkflowExecutor,
+    EnhancedGraph,
+    execute_workflow_sync,
+)
 from genxai.core.graph.nodes import InputNode, OutputNode, AgentNode
 from genxai.core.graph.edges import Edge
 from genxai.core.agent.base import AgentFactory
@@ -11,6 +18,14 @@ from genxai.core.graph.engine import GraphExecutionError, Graph
 from genxai.core.graph.nodes import ToolNode
 
 
+# Shared input -> output workflow definition. Executor code only reads these.
+SIMPLE_NODES = (
+    {"id": "input", "type": "input"},
+    {"id": "output", "type": "output"},
+)
+SIMPLE_EDGES = ({"source": "input", "target": "output"},)
+
+
 def test_workflow_executor_initialization():
     """Test workflow executor initialization."""
     executor = WorkflowExecutor(register_builtin_tools=False)
@@ -71,17 +86,8 @@ def test_create_agents_from_nodes():
 def test_build_graph_with_input_output():
     """Test building graph with input and output nodes."""
     executor = WorkflowExecutor(register_builtin_tools=False)
-    
-    nodes = [
-        {"id": "input", "type": "input"},
-        {"id": "output", "type": "output"}
-    ]
-    
-    edges = [
-        {"source": "input", "target": "output"}
-    ]
-    
-    graph = executor._build_graph(nodes, edges)
+
+    graph = executor._build_graph(SIMPLE_NODES, SIMPLE_EDGES)
     
     assert len(graph.nodes) == 2
     assert len(graph.edges) == 1
@@ -123,6 +129,31 @@ def test_build_graph_with_agent_node():
     AgentRegistry.clear()
 
 
+def test_build_and_register_matches_separate_passes():
+    """Single-pass build registers agents and builds the same graph."""
+    AgentRegistry.clear()
+
+    executor = WorkflowExecutor(register_builtin_tools=False)
+
+    nodes = [
+        {"id": "input", "type": "input"},
+        {"id": "agent1", "type": "agent", "config": {"role": "Test Agent"}},
+        {"id": "output", "type": "output"},
+    ]
+    edges = [
+        {"source": "input", "target": "agent1"},
+        {"source": "agent1", "target": "output"},
+    ]
+
+    graph = executor._build_and_register(nodes, edges)
+
+    assert AgentRegistry.get("agent1").config.role == "Test Agent"
+    assert list(graph.nodes) == ["input", "agent1", "output"]
+    assert len(graph.edges) == 2
+
+    AgentRegistry.clear()
+
+
 def test_build_graph_with_conditional_edge():
     """Test building graph with conditional edge."""
     executor = WorkflowExecutor(register_builtin_tools=False)
@@ -165,32 +196,6 @@ def test_evaluate_condition_false():
     assert result is False
 
 
-@pytest.mark.asyncio
-async def test_execute_simple_workflow():
-    """Test executing a simple workflow."""
-    AgentRegistry.clear()
-    
-    executor = WorkflowExecutor(register_builtin_tools=False)
-    
-    nodes = [
-        {"id": "input", "type": "input"},
-        {"id": "output", "type": "output"}
-    ]
-    
-    edges = [
-        {"source": "input", "target": "output"}
-    ]
-    
-    input_data = {"message": "test"}
-    
-    result = await executor.execute(nodes, edges, input_data)
-    
-    assert result["status"] == "success"
-    assert "result" in result
-    
-    AgentRegistry.clear()
-
-
 @pytest.mark.asyncio
 async def test_execute_workflow_with_error():
     """Test executing workflow with invalid configuration."""
@@ -204,6 +209,31 @@ async def test_execute_workflow_with_error():
     
     assert result["status"] == "error"
     assert "error" in result
+    assert "result" not in result
+
+
+def test_execution_result_mapping_view():
+    """ExecutionResult mirrors the legacy dict shape for each status."""
+    ok = ExecutionResult(status="success", run_id="r1", message="done", result={"x": 1})
+    assert ok["result"] == {"x": 1}
+    assert ok.get("error") is None
+    assert set(ok.to_dict()) == {
+        "status", "run_id", "result", "node_events", "nodes_executed", "message"
+    }
+
+    failed = ExecutionResult(status="error", run_id="r2", message="failed", error="boom")
+    assert failed.to_dict() == {
+        "status": "error", "run_id": "r2", "error": "boom", "message": "failed"
+    }
+    with pytest.raises(KeyError):
+        failed["result"]
+
+    # Behaves as a read-only mapping for dict-style callers
+    assert dict(ok) == ok.to_dict()
+    assert {**failed} == failed.to_dict()
+    assert failed == failed.to_dict()
+    assert list(failed.items()) == list(failed.to_dict().items())
+    assert "error" in failed and "result" not in failed
 
 
 def test_enhanced_graph_initialization():
@@ -213,9 +243,8 @@ def test_enhanced_graph_initialization():
     assert len(graph.nodes) == 0
 
 
-@pytest.mark.asyncio
-async def test_enhanced_graph_execute_input_node():
-    """Test enhanced graph executing input node."""
+async def _check_enhanced_graph_input_node():
+    """Enhanced graph returns the input payload for an input node."""
     graph = EnhancedGraph(name="test")
     
     input_node = InputNode()
@@ -227,9 +256,8 @@ async def test_enhanced_graph_execute_input_node():
     assert result == {"data": "test"}
 
 
-@pytest.mark.asyncio
-async def test_enhanced_graph_execute_output_node():
-    """Test enhanced graph executing output node."""
+async def _check_enhanced_graph_output_node():
+    """Enhanced graph returns the state for an output node."""
     graph = EnhancedGraph(name="test")
     
     output_node = OutputNode()
@@ -242,20 +270,37 @@ async def test_enhanced_graph_execute_output_node():
     assert result["key"] == "value"
 
 
+async def _check_execute_simple_workflow():
+    """A simple input -> output workflow executes successfully."""
+    executor = WorkflowExecutor(register_builtin_tools=False)
+
+    input_data = {"message": "test"}
+
+    result = await executor.execute(SIMPLE_NODES, SIMPLE_EDGES, input_data)
+    
+    assert result["status"] == "success"
+    assert "result" in result
+
+
+@pytest.mark.asyncio
+async def test_enhanced_graph_bundle():
+    """Run the independent positive-path execution checks concurrently."""
+    AgentRegistry.clear()
+
+    await asyncio.gather(
+        _check_enhanced_graph_input_node(),
+        _check_enhanced_graph_output_node(),
+        _check_execute_simple_workflow(),
+    )
+
+    AgentRegistry.clear()
+
+
 def test_execute_workflow_sync_wrapper():
     """Test synchronous workflow execution wrapper."""
-    nodes = [
-        {"id": "input", "type": "input"},
-        {"id": "output", "type": "output"}
-    ]
-    
-    edges = [
-        {"source": "input", "target": "output"}
-    ]
-    
     input_data = {"test": "data"}
-    
-    result = execute_workflow_sync(nodes, edges, input_data)
+
+    result = execute_workflow_sync(SIMPLE_NODES, SIMPLE_EDGES, input_data)
     
     assert result["status"] == "success"
 
@@ -274,21 +319,39 @@ async def test_workflow_executor_cleanup():
             "type": "agent",
             "config": {"role": "Test", "goal": "Test"}
         },
-        {"id": "input", "type": "input"},
-        {"id": "output", "type": "output"}
+        *SIMPLE_NODES,
     ]
-    
-    edges = [
-        {"source": "input", "target": "output"}
-    ]
-    
+
     # Execute workflow
-    await executor.execute(nodes, edges, {})
+    await executor.execute(nodes, SIMPLE_EDGES, {})
     
     # Verify registry was cleared
     assert len(AgentRegistry.list_all()) == 0
 
 
+@pytest.mark.asyncio
+async def test_execute_model_override_leaves_nodes_unchanged(monkeypatch):
+    """Test that model_override is applied without mutating the caller's nodes."""
+    AgentRegistry.clear()
+    executor = WorkflowExecutor(register_builtin_tools=False)
+    agent_node = {"id": "agent1", "type": "agent", "config": {"role": "Test", "goal": "Test"}}
+    nodes = (agent_node, *SIMPLE_NODES)
+
+    built = []
+    build_and_register = executor._build_and_register
+
+    def spy(nodes, edges):
+        built.extend(nodes)
+        return build_and_register(nodes, edges)
+
+    monkeypatch.setattr(executor, "_build_and_register", spy)
+    await executor.execute(nodes, SIMPLE_EDGES, {}, model_override="gpt-4-turbo")
+
+    assert built[0]["config"] == {"role": "Test", "goal": "Test", "llm_model": "gpt-4-turbo"}
+    assert agent_node == {"id": "agent1", "type": "agent", "config": {"role": "Test", "goal": "Test"}}
+    assert built[1:] == list(SIMPLE_NODES)
+
+
 @pytest.mark.asyncio
 async def test_graph_run_with_no_entry_point():
     """Graph should error when no entry point exists."""
@@ -1,7 +1,8 @@
 """Unit tests for LLM Provider Factory."""
 
+import importlib
+
 import pytest
-from unittest.mock import patch, MagicMock
 from genxai.llm.factory import LLMProviderFactory
 from genxai.llm.providers.openai import OpenAIProvider
 
@@ -21,16 +22,16 @@ def test_create_openai_provider():
     assert provider.max_tokens == 1000
 
 
-def test_create_provider_with_env_var():
+def test_create_provider_with_env_var(monkeypatch):
     """Test creating provider with API key from environment."""
-    with patch.dict("os.environ", {"OPENAI_API_KEY": "env-test-key"}):
-        provider = LLMProviderFactory.create_provider(
-            model="gpt-3.5-turbo",
-            temperature=0.7,
-        )
-        
-        assert isinstance(provider, OpenAIProvider)
-        assert provider.api_key == "env-test-key"
+    monkeypatch.setenv("OPENAI_API_KEY", "env-test-key")
+    provider = LLMProviderFactory.create_provider(
+        model="gpt-3.5-turbo",
+        temperature=0.7,
+    )
+
+    assert isinstance(provider, OpenAIProvider)
+    assert provider.api_key == "env-test-key"
 
 
 def test_create_provider_unknown_model():
@@ -42,18 +43,26 @@ def test_create_provider_unknown_model():
         )
 
 
-def test_create_provider_with_fallback():
+def test_create_provider_with_fallback(monkeypatch):
     """Test fallback model logic."""
-    # Mock the provider creation to fail for first model
-    with patch.object(OpenAIProvider, "__init__", side_effect=[Exception("API Error"), None]):
-        # This should fail on gpt-4 but succeed on fallback
-        with patch.object(OpenAIProvider, "__init__", return_value=None):
-            provider = LLMProviderFactory.create_provider(
-                model="gpt-4",
-                api_key="test-key",
-                fallback_models=["gpt-3.5-turbo"],
-            )
-            # If we get here, fallback worked
+    calls = []
+
+    def fake_init(self, model, **kwargs):
+        calls.append(model)
+        # Fail for the primary model, succeed for the fallback
+        if len(calls) == 1:
+            raise Exception("API Error")
+
+    monkeypatch.setattr(OpenAIProvider, "__init__", fake_init)
+
+    provider = LLMProviderFactory.create_provider(
+        model="gpt-4",
+        api_key="test-key",
+        fallback_models=["gpt-3.5-turbo"],
+    )
+
+    assert isinstance(provider, OpenAIProvider)
+    assert calls == ["gpt-4", "gpt-3.5-turbo"]
 
 
 def test_supports_model():
@@ -157,32 +166,22 @@ def test_get_provider_class():
     assert provider_class is None
 
 
-def test_get_api_key_for_provider():
+@pytest.mark.parametrize(
+    ("module_name", "class_name", "env_var"),
+    [
+        ("genxai.llm.providers.openai", "OpenAIProvider", "OPENAI_API_KEY"),
+        ("genxai.llm.providers.anthropic", "AnthropicProvider", "ANTHROPIC_API_KEY"),
+        ("genxai.llm.providers.google", "GoogleProvider", "GOOGLE_API_KEY"),
+        ("genxai.llm.providers.cohere", "CohereProvider", "COHERE_API_KEY"),
+    ],
+)
+def test_get_api_key_for_provider(monkeypatch, module_name, class_name, env_var):
     """Test API key retrieval from environment."""
-    # OpenAI
-    with patch.dict("os.environ", {"OPENAI_API_KEY": "test-openai-key"}):
-        api_key = LLMProviderFactory._get_api_key_for_provider(OpenAIProvider)
-        assert api_key == "test-openai-key"
-    
-    # Anthropic
-    with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-anthropic-key"}):
-        from genxai.llm.providers.anthropic import AnthropicProvider
-        api_key = LLMProviderFactory._get_api_key_for_provider(AnthropicProvider)
-        assert api_key == "test-anthropic-key"
-    
-    # Google
-    with patch.dict("os.environ", {"GOOGLE_API_KEY": "test-google-key"}):
-        from genxai.llm.providers.google import GoogleProvider
-        api_key = LLMProviderFactory._get_api_key_for_provider(GoogleProvider)
-        assert api_key == "test-google-key"
-    
-    # Cohere
-    with patch.dict("os.environ", {"COHERE_API_KEY": "test-cohere-key"}):
-        from genxai.llm.providers.cohere import CohereProvider
-        api_key = LLMProviderFactory._get_api_key_for_provider(CohereProvider)
-        assert api_key == "test-cohere-key"
-    
-    # Test with no env var
-    with patch.dict("os.environ", {}, clear=True):
-        api_key = LLMProviderFactory._get_api_key_for_provider(OpenAIProvider)
-        assert api_key is None
+    # Import inside the case so each provider module loads only when selected.
+    provider_class = getattr(importlib.import_module(module_name), class_name)
+
+    monkeypatch.setenv(env_var, "test-key")
+    assert LLMProviderFactory._get_api_key_for_provider(provider_class) == "test-key"
+
+    monkeypatch.delenv(env_var)
+    assert LLMProviderFactory._get_api_key_for_provider(provider_class) is None
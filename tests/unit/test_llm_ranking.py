@@ -6,26 +6,37 @@ from genxai.utils.llm_ranking import RankCandidate, rank_candidates_with_llm
 from tests.utils.mock_llm import MockLLMProvider
 
 
+_VALID_JSON = (
+    "{"
+    "\"ranked_ids\":[\"a\",\"b\"],"
+    "\"scores\":{\"a\":0.9,\"b\":0.1},"
+    "\"rationales\":{\"a\":\"best\",\"b\":\"ok\"},"
+    "\"selected_id\":\"a\","
+    "\"confidence\":0.82"
+    "}"
+)
+_REPAIRED_JSON = (
+    "Here is your JSON: {'ranked_ids': ['b', 'a'], 'scores': {'a': 0.2, 'b': 0.8}, "
+    "'rationales': {'a': 'ok', 'b': 'best'}, 'selected_id': 'b', 'confidence': 0.6}"
+)
+_NO_JSON = "No JSON here."
+
+_ALPHA_BETA = (
+    RankCandidate(id="a", content="Alpha"),
+    RankCandidate(id="b", content="Beta"),
+)
+
+
+def _mock(text: str) -> MockLLMProvider:
+    return MockLLMProvider(response_text=text)
+
+
 @pytest.mark.asyncio
 async def test_rank_candidates_with_llm_valid_json() -> None:
-    provider = MockLLMProvider(
-        response_text=(
-            "{"
-            "\"ranked_ids\":[\"a\",\"b\"],"
-            "\"scores\":{\"a\":0.9,\"b\":0.1},"
-            "\"rationales\":{\"a\":\"best\",\"b\":\"ok\"},"
-            "\"selected_id\":\"a\","
-            "\"confidence\":0.82"
-            "}"
-        ),
-    )
     decision = await rank_candidates_with_llm(
         task="Pick best",
-        candidates=[
-            RankCandidate(id="a", content="Alpha"),
-            RankCandidate(id="b", content="Beta"),
-        ],
-        llm_provider=provider,
+        candidates=list(_ALPHA_BETA),
+        llm_provider=_mock(_VALID_JSON),
     )
 
     assert decision.selected_id == "a"
@@ -36,20 +47,10 @@ async def test_rank_candidates_with_llm_valid_json() -> None:
 
 @pytest.mark.asyncio
 async def test_rank_candidates_with_llm_repaired_json() -> None:
-    provider = MockLLMProvider(
-        response_text=(
-            "Here is your JSON: {'ranked_ids': ['b', 'a'], 'scores': {'a': 0.2, 'b': 0.8}, "
-            "'rationales': {'a': 'ok', 'b': 'best'}, 'selected_id': 'b', 'confidence': 0.6}"
-        ),
-    )
-
     decision = await rank_candidates_with_llm(
         task="Pick best",
-        candidates=[
-            RankCandidate(id="a", content="Alpha"),
-            RankCandidate(id="b", content="Beta"),
-        ],
-        llm_provider=provider,
+        candidates=list(_ALPHA_BETA),
+        llm_provider=_mock(_REPAIRED_JSON),
     )
 
     assert decision.selected_id == "b"
@@ -59,14 +60,13 @@ async def test_rank_candidates_with_llm_repaired_json() -> None:
 
 @pytest.mark.asyncio
 async def test_rank_candidates_with_llm_fallback() -> None:
-    provider = MockLLMProvider(response_text="No JSON here.")
     decision = await rank_candidates_with_llm(
         task="Find alpha",
         candidates=[
             RankCandidate(id="a", content="Alpha response"),
             RankCandidate(id="b", content="Beta response"),
         ],
-        llm_provider=provider,
+        llm_provider=_mock(_NO_JSON),
     )
 
     assert decision.method_used == "heuristic_fallback"
@@ -75,7 +75,6 @@ async def test_rank_candidates_with_llm_fallback() -> None:
 
 @pytest.mark.asyncio
 async def test_rank_candidates_with_llm_fallback_keywords_and_phrase() -> None:
-    provider = MockLLMProvider(response_text="N/A")
     decision = await rank_candidates_with_llm(
         task="exact phrase",
         candidates=[
@@ -90,7 +89,7 @@ async def test_rank_candidates_with_llm_fallback_keywords_and_phrase() -> None:
                 metadata={"keywords": ["unrelated"]},
             ),
         ],
-        llm_provider=provider,
+        llm_provider=_mock("N/A"),
     )
 
     assert decision.method_used == "heuristic_fallback"
@@ -1,7 +1,11 @@
 """Unit tests for memory persistence backends."""
 
 from pathlib import Path
+import math
 
+import pytest
+
+from genxai.core.memory import persistence
 from genxai.core.memory.persistence import (
     MemoryPersistenceConfig,
     JsonMemoryStore,
@@ -10,6 +14,30 @@ from genxai.core.memory.persistence import (
 )
 
 
+# Tests don't need durability; skip the journal fsyncs.
+TEST_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF", "temp_store": "MEMORY"}
+
+
+@pytest.fixture(scope="module")
+def shared_sqlite_store(tmp_path_factory: pytest.TempPathFactory) -> SqliteMemoryStore:
+    config = MemoryPersistenceConfig(
+        base_dir=tmp_path_factory.mktemp("sqlite"), enabled=True, backend="sqlite"
+    )
+    return SqliteMemoryStore(config, pragma_overrides=TEST_PRAGMAS)
+
+
+@pytest.fixture
+def sqlite_store(shared_sqlite_store: SqliteMemoryStore):
+    yield shared_sqlite_store
+    conn = shared_sqlite_store._get_connection()
+    try:
+        conn.execute("DELETE FROM memory_blobs")
+        conn.execute("DELETE FROM long_term_metadata")
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def test_json_memory_store_save_and_load(tmp_path: Path) -> None:
     config = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="json")
     store = JsonMemoryStore(config)
@@ -26,9 +54,29 @@ def test_json_memory_store_mapping(tmp_path: Path) -> None:
     assert store.load_mapping("map.json") == mapping
 
 
-def test_sqlite_memory_store_roundtrip(tmp_path: Path) -> None:
-    config = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="sqlite")
-    store = SqliteMemoryStore(config)
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_memory_store_round_trips_values_orjson_rejects(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson and not persistence.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(persistence, "ORJSON_AVAILABLE", use_orjson)
+    config = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="json")
+    store = JsonMemoryStore(config)
+
+    store.save_mapping("map.json", {"score": float("nan")})
+    assert math.isnan(store.load_mapping("map.json")["score"])
+
+    # orjson would read this back as a float
+    store.save_mapping("big.json", {"big": 2**70 + 1})
+    assert store.load_mapping("big.json") == {"big": 2**70 + 1}
+
+    store.save_list("items.json", [{"inf": float("inf")}])
+    assert store.load_list("items.json") == [{"inf": float("inf")}]
+
+
+def test_sqlite_memory_store_roundtrip(sqlite_store: SqliteMemoryStore) -> None:
+    store = sqlite_store
     items = [{"id": "1", "value": "alpha"}]
     store.save_list("items", items)
     assert store.load_list("items") == items
@@ -41,3 +89,17 @@ def test_create_memory_store_factory(tmp_path: Path) -> None:
     config = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="sqlite")
     store = create_memory_store(config)
     assert isinstance(store, SqliteMemoryStore)
+
+
+def test_sqlite_memory_store_pragma_overrides(sqlite_store: SqliteMemoryStore) -> None:
+    conn = sqlite_store._get_connection()
+    try:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def test_sqlite_memory_store_rejects_invalid_pragma(tmp_path: Path) -> None:
+    config = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="sqlite")
+    with pytest.raises(ValueError):
+        SqliteMemoryStore(config, pragma_overrides={"synchronous": "OFF; DROP TABLE x"})
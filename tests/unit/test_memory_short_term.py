@@ -7,18 +7,28 @@ from genxai.core.memory.base import Memory, MemoryType
 from genxai.core.memory.short_term import ShortTermMemory
 
 
+_TS = datetime(2024, 1, 1)
+
+
+def _mem(memory_id: str, content: str) -> Memory:
+    # Trusted test data: skip pydantic validation
+    return Memory.model_construct(
+        id=memory_id, content=content, type=MemoryType.SHORT_TERM, timestamp=_TS
+    )
+
+
 def test_short_term_store_and_retrieve() -> None:
     memory = ShortTermMemory(capacity=2)
-    mem = Memory(id="1", content="hello", type=MemoryType.SHORT_TERM, timestamp=datetime.now())
+    mem = _mem("1", "hello")
     memory.store(mem)
     assert memory.retrieve("1") == mem
 
 
 def test_short_term_eviction() -> None:
     memory = ShortTermMemory(capacity=2)
-    memory.store(Memory(id="1", content="a", type=MemoryType.SHORT_TERM, timestamp=datetime.now()))
-    memory.store(Memory(id="2", content="b", type=MemoryType.SHORT_TERM, timestamp=datetime.now()))
-    memory.store(Memory(id="3", content="c", type=MemoryType.SHORT_TERM, timestamp=datetime.now()))
+    memory.store(_mem("1", "a"))
+    memory.store(_mem("2", "b"))
+    memory.store(_mem("3", "c"))
     assert memory.retrieve("1") is None
     assert memory.retrieve("2") is not None
     assert memory.retrieve("3") is not None
@@ -26,13 +36,25 @@ def test_short_term_eviction() -> None:
 
 def test_short_term_search() -> None:
     memory = ShortTermMemory(capacity=3)
-    memory.store(Memory(id="1", content="alpha", type=MemoryType.SHORT_TERM, timestamp=datetime.now()))
-    memory.store(Memory(id="2", content="beta", type=MemoryType.SHORT_TERM, timestamp=datetime.now()))
-    memory.store(Memory(id="3", content="alphonse", type=MemoryType.SHORT_TERM, timestamp=datetime.now()))
+    memory.store(_mem("1", "alpha"))
+    memory.store(_mem("2", "beta"))
+    memory.store(_mem("3", "alphonse"))
     matches = memory.search("alp")
     assert len(matches) == 2
 
 
+def test_short_term_search_index_tracks_eviction_and_delete() -> None:
+    memory = ShortTermMemory(capacity=2)
+    memory.store(_mem("1", "Alpha"))
+    memory.store(_mem("2", "alphonse"))
+    memory.store(_mem("3", "alpine"))
+    assert [m.id for m in memory.search("ALP")] == ["3", "2"]
+    assert memory.search("pha") == []
+
+    memory.delete("2")
+    assert [m.id for m in memory.search("al")] == ["3"]
+
+
 def test_short_term_context_async() -> None:
     memory = ShortTermMemory(capacity=2)
 
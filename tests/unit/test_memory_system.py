@@ -1,6 +1,7 @@
 """Tests for memory system."""
 
 import pytest
+from datetime import datetime
 from pathlib import Path
 from genxai.core.memory.manager import MemorySystem
 from genxai.core.memory.base import Memory, MemoryType
@@ -8,19 +9,31 @@ from genxai.core.memory.long_term import LongTermMemory
 from genxai.core.memory.persistence import MemoryPersistenceConfig
 
 
+@pytest.fixture(scope="module")
+def shared_memory():
+    """One in-memory MemorySystem shared by the non-persistent tests."""
+    return MemorySystem(agent_id="test_agent")
+
+
+@pytest.fixture
+def memory(shared_memory):
+    """Shared MemorySystem, reset after each test."""
+    yield shared_memory
+    shared_memory.short_term.clear()
+    shared_memory.clear_working()
+
+
 @pytest.mark.asyncio
-async def test_memory_system_initialization():
+async def test_memory_system_initialization(memory):
     """Test memory system initialization."""
-    memory = MemorySystem(agent_id="test_agent")
     assert memory.agent_id == "test_agent"
     assert memory.short_term is not None
     assert memory.working is not None
 
 
 @pytest.mark.asyncio
-async def test_add_to_short_term():
+async def test_add_to_short_term(memory):
     """Test adding to short-term memory."""
-    memory = MemorySystem(agent_id="test_agent")
     await memory.add_to_short_term(
         content={"message": "Hello"},
         metadata={"timestamp": 123456}
@@ -30,18 +43,16 @@ async def test_add_to_short_term():
 
 
 @pytest.mark.asyncio
-async def test_working_memory():
+async def test_working_memory(memory):
     """Test working memory operations."""
-    memory = MemorySystem(agent_id="test_agent")
     memory.add_to_working("key1", "value1")
     assert memory.get_from_working("key1") == "value1"
     assert memory.get_from_working("nonexistent") is None
 
 
 @pytest.mark.asyncio
-async def test_memory_stats():
+async def test_memory_stats(memory):
     """Test memory statistics."""
-    memory = MemorySystem(agent_id="test_agent")
     stats = await memory.get_stats()
     assert "agent_id" in stats
     assert stats["agent_id"] == "test_agent"
@@ -50,9 +61,8 @@ async def test_memory_stats():
 
 
 @pytest.mark.asyncio
-async def test_clear_short_term():
+async def test_clear_short_term(memory):
     """Test clearing short-term memory."""
-    memory = MemorySystem(agent_id="test_agent")
     await memory.add_to_short_term(content={"test": "data"})
     await memory.clear_short_term()
     context = await memory.get_short_term_context()
@@ -60,9 +70,8 @@ async def test_clear_short_term():
 
 
 @pytest.mark.asyncio
-async def test_clear_working():
+async def test_clear_working(memory):
     """Test clearing working memory."""
-    memory = MemorySystem(agent_id="test_agent")
     memory.add_to_working("key1", "value1")
     memory.clear_working()
     assert memory.get_from_working("key1") is None
@@ -115,11 +124,11 @@ async def test_long_term_memory_persistence(tmp_path: Path):
     persistence = MemoryPersistenceConfig(base_dir=tmp_path, enabled=True, backend="sqlite")
     long_term = LongTermMemory(config=None, persistence=persistence)
 
-    memory = Memory(
+    memory = Memory.model_construct(
         id="memory-1",
         type=MemoryType.LONG_TERM,
         content={"note": "persistent"},
-        timestamp=__import__("datetime").datetime.now(),
+        timestamp=datetime(2024, 1, 1),
     )
     long_term.store(memory)
 
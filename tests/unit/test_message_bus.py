@@ -6,6 +6,18 @@ from typing import Any
 from genxai.core.communication.message_bus import MessageBus, Message
 
 
+@pytest.fixture
+async def populated_bus():
+    """Message bus pre-loaded with three messages between a1, a2 and a3."""
+    bus = MessageBus()
+    await asyncio.gather(
+        bus.send(Message(id="", sender="a1", recipient="a2", content="msg1")),
+        bus.send(Message(id="", sender="a2", recipient="a3", content="msg2")),
+        bus.send(Message(id="", sender="a1", recipient="a3", content="msg3")),
+    )
+    return bus
+
+
 def test_message_creation():
     """Test creating a message."""
     msg = Message(
@@ -58,10 +70,12 @@ async def test_send_message_with_callback():
     """Test sending message with subscriber callback."""
     bus = MessageBus()
     received_messages = []
+    delivered = asyncio.Event()
     
     # Define callback
     async def callback(msg: Message):
         received_messages.append(msg)
+        delivered.set()
     
     # Subscribe agent2
     bus.subscribe("agent2", callback)
@@ -75,8 +89,8 @@ async def test_send_message_with_callback():
     )
     await bus.send(msg)
     
-    # Wait a bit for async callback
-    await asyncio.sleep(0.1)
+    # Wait for the callback to fire
+    await asyncio.wait_for(delivered.wait(), timeout=1.0)
     
     # Verify callback was called
     assert len(received_messages) == 1
@@ -89,13 +103,17 @@ async def test_broadcast_message():
     bus = MessageBus()
     received_by_agent1 = []
     received_by_agent2 = []
+    done1 = asyncio.Event()
+    done2 = asyncio.Event()
     
     # Define callbacks
     async def callback1(msg: Message):
         received_by_agent1.append(msg)
+        done1.set()
     
     async def callback2(msg: Message):
         received_by_agent2.append(msg)
+        done2.set()
     
     # Subscribe agents
     bus.subscribe("agent1", callback1)
@@ -110,7 +128,7 @@ async def test_broadcast_message():
     await bus.broadcast(msg)
     
     # Wait for async callbacks
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(asyncio.gather(done1.wait(), done2.wait()), timeout=1.0)
     
     # Verify both agents received
     assert len(received_by_agent1) == 1
@@ -123,10 +141,12 @@ async def test_broadcast_to_group():
     bus = MessageBus()
     received_by_group = []
     received_by_other = []
+    group_done = asyncio.Event()
     
     # Define callbacks
     async def group_callback(msg: Message):
         received_by_group.append(msg)
+        group_done.set()
     
     async def other_callback(msg: Message):
         received_by_other.append(msg)
@@ -143,8 +163,9 @@ async def test_broadcast_to_group():
     )
     await bus.broadcast(msg, group="group")
     
-    # Wait for async callbacks
-    await asyncio.sleep(0.1)
+    # Wait for the group callback; delivery is sequential, so the
+    # non-member would already have been called by now.
+    await asyncio.wait_for(group_done.wait(), timeout=1.0)
     
     # Verify only group agent received
     assert len(received_by_group) == 1
@@ -199,61 +220,71 @@ def test_unsubscribe_specific_callback():
     assert len(bus._subscribers["agent1"]) == 1
 
 
-def test_get_history():
+def test_get_history(populated_bus):
     """Test getting message history."""
-    bus = MessageBus()
-    
-    # Send some messages
-    asyncio.run(bus.send(Message(id="", sender="a1", recipient="a2", content="msg1")))
-    asyncio.run(bus.send(Message(id="", sender="a2", recipient="a1", content="msg2")))
-    
-    # Get all history
-    history = bus.get_history()
-    assert len(history) == 2
+    history = populated_bus.get_history()
+    assert len(history) == 3
 
 
-def test_get_history_filtered():
+def test_get_history_filtered(populated_bus):
     """Test getting filtered message history."""
-    bus = MessageBus()
-    
-    # Send messages
-    asyncio.run(bus.send(Message(id="", sender="a1", recipient="a2", content="msg1")))
-    asyncio.run(bus.send(Message(id="", sender="a2", recipient="a3", content="msg2")))
-    asyncio.run(bus.send(Message(id="", sender="a1", recipient="a3", content="msg3")))
-    
-    # Get history for agent1
-    history = bus.get_history(agent_id="a1")
+    history = populated_bus.get_history(agent_id="a1")
     assert len(history) == 2  # a1 sent 2 messages
 
 
-def test_get_history_with_limit():
+@pytest.mark.asyncio
+async def test_get_history_with_limit():
     """Test getting limited message history."""
     bus = MessageBus()
     
     # Send multiple messages
-    for i in range(5):
-        asyncio.run(bus.send(Message(id="", sender="a1", recipient="a2", content=f"msg{i}")))
+    await asyncio.gather(
+        *(bus.send(Message(id="", sender="a1", recipient="a2", content=f"msg{i}")) for i in range(5))
+    )
     
     # Get last 3 messages
     history = bus.get_history(limit=3)
     assert len(history) == 3
 
 
-def test_clear_history():
+@pytest.mark.asyncio
+async def test_history_limit_evicts_oldest():
+    """Test that history is bounded and filtered views drop evicted messages."""
+    bus = MessageBus(history_limit=2)
+    
+    await bus.send(Message(id="", sender="a1", recipient="a2", content="msg1"))
+    await bus.send(Message(id="", sender="a2", recipient="a3", content="msg2"))
+    await bus.send(Message(id="", sender="a3", recipient="a2", content="msg3"))
+    
+    assert [m.content for m in bus.get_history()] == ["msg2", "msg3"]
+    assert bus.get_history(agent_id="a1") == []
+    assert [m.content for m in bus.get_history(agent_id="a2")] == ["msg2", "msg3"]
+    assert [m.content for m in bus.get_history(agent_id="a2", limit=1)] == ["msg3"]
+    assert bus.get_stats()["total_messages"] == 3
+
+
+@pytest.mark.asyncio
+async def test_zero_history_limit_keeps_nothing():
+    """Test that history_limit=0 disables history without failing sends."""
+    bus = MessageBus(history_limit=0)
+
+    await bus.send(Message(id="", sender="a1", recipient="a2", content="msg1"))
+    await bus.send(Message(id="", sender="a2", recipient="a1", content="msg2"))
+
+    assert bus.get_history() == []
+    assert bus.get_history(agent_id="a1") == []
+    assert bus.get_stats()["total_messages"] == 2
+
+
+def test_clear_history(populated_bus):
     """Test clearing message history."""
-    bus = MessageBus()
-    
-    # Send messages
-    asyncio.run(bus.send(Message(id="", sender="a1", recipient="a2", content="msg1")))
-    asyncio.run(bus.send(Message(id="", sender="a2", recipient="a1", content="msg2")))
-    
-    # Clear history
-    bus.clear_history()
+    populated_bus.clear_history()
     
-    assert len(bus._message_history) == 0
+    assert len(populated_bus._message_history) == 0
 
 
-def test_get_stats():
+@pytest.mark.asyncio
+async def test_get_stats():
     """Test getting message bus statistics."""
     bus = MessageBus()
     
@@ -262,7 +293,7 @@ def test_get_stats():
     bus.subscribe("agent2", lambda msg: None)
     
     # Send messages
-    asyncio.run(bus.send(Message(id="", sender="a1", recipient="a2", content="msg1")))
+    await bus.send(Message(id="", sender="a1", recipient="a2", content="msg1"))
     
     # Get stats
     stats = bus.get_stats()
@@ -273,11 +304,12 @@ def test_get_stats():
     assert "agent2" in stats["subscriber_list"]
 
 
-def test_message_bus_repr():
+@pytest.mark.asyncio
+async def test_message_bus_repr():
     """Test message bus string representation."""
     bus = MessageBus()
     bus.subscribe("agent1", lambda msg: None)
-    asyncio.run(bus.send(Message(id="", sender="a1", recipient="a2", content="msg")))
+    await bus.send(Message(id="", sender="a1", recipient="a2", content="msg"))
     
     repr_str = repr(bus)
     assert "MessageBus" in repr_str
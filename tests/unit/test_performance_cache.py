@@ -1,7 +1,6 @@
 """Unit tests for performance cache utilities."""
 
 import asyncio
-import time
 
 from genxai.performance.cache import CacheManager, MemoryCache, cached, LRUCache
 
@@ -15,10 +14,11 @@ def test_memory_cache_basic() -> None:
 
 
 def test_memory_cache_ttl_expiry() -> None:
-    cache = MemoryCache()
+    clock = [0.0]
+    cache = MemoryCache(time_func=lambda: clock[0])
     cache.set("beta", "value", ttl=1)
     assert cache.get("beta") == "value"
-    time.sleep(1.2)
+    clock[0] = 1.2
     assert cache.get("beta") is None
 
 
@@ -29,6 +29,13 @@ def test_cache_manager_key_determinism() -> None:
     assert key1 == key2
 
 
+def test_cache_manager_key_distinguishes_equal_values_of_other_types() -> None:
+    cache = CacheManager(MemoryCache())
+    assert cache.cache_key("prefix", 1) != cache.cache_key("prefix", True)
+    assert cache.cache_key("prefix", 0.0) != cache.cache_key("prefix", -0.0)
+    assert cache.cache_key("prefix", [1]) == cache.cache_key("prefix", [1])
+
+
 def test_lru_cache_eviction() -> None:
     lru = LRUCache(capacity=2)
     lru.set("a", 1)
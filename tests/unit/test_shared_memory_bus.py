@@ -1,5 +1,7 @@
 """Unit tests for shared memory bus."""
 
+import asyncio
+
 import pytest
 
 from genxai.core.memory.shared import SharedMemoryBus
@@ -22,4 +24,27 @@ async def test_shared_memory_bus_subscribe():
 
     bus.subscribe("plan", on_update)
     await bus.set("plan", 1)
-    assert updates == [1]
\ No newline at end of file
+    assert updates == [1]
+
+
+@pytest.mark.asyncio
+async def test_shared_memory_bus_notifies_subscribers_concurrently():
+    bus = SharedMemoryBus()
+    both_started = asyncio.Event()
+    started = []
+
+    async def on_update(entry):
+        started.append(entry.value)
+        if len(started) == 2:
+            both_started.set()
+        # Only finishes if the other subscriber runs while this one waits
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    async def failing(entry):
+        raise RuntimeError("boom")
+
+    bus.subscribe("plan", on_update)
+    bus.subscribe("plan", failing)
+    bus.subscribe("plan", on_update)
+    await bus.set("plan", 1)
+    assert started == [1, 1]
@@ -61,3 +61,22 @@ def test_state_to_dict():
     manager.set("key1", "value1")
     state_dict = manager.to_dict()
     assert "state" in state_dict or "data" in state_dict or state_dict.get("key1") == "value1"
+
+
+def test_checkpoint_is_isolated_from_later_writes():
+    """Test that writes after a checkpoint don't leak into it."""
+    manager = StateManager()
+    manager.set("key1", "value1")
+    manager.checkpoint("checkpoint1")
+    version = manager.to_dict()["version"]
+    manager.set("key1", "value2")
+    manager.set("key2", "value3")
+    manager.delete("key1")
+
+    manager.rollback(version)
+    assert manager.get_all() == {"key1": "value1"}
+
+    # Writes after a rollback must not alter the checkpoint either
+    manager.set("key1", "changed")
+    manager.rollback(version)
+    assert manager.get("key1") == "value1"
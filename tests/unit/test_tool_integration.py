@@ -2,7 +2,7 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock
+from types import SimpleNamespace
 from typing import Dict, Any
 
 from genxai.core.agent.base import Agent, AgentConfig
@@ -17,7 +17,7 @@ class MockTool:
         self.return_value = return_value
         self.call_count = 0
         self.calls = []
-        self.metadata = Mock(description="Mock tool for testing")
+        self.metadata = SimpleNamespace(description="Mock tool for testing")
     
     async def execute(self, **kwargs):
         """Mock execute method."""
@@ -26,16 +26,30 @@ class MockTool:
         return self.return_value
 
 
+class FailingTool:
+    """Synchronous tool that always raises."""
+
+    def __init__(self, message: str):
+        self.message = message
+        self.metadata = SimpleNamespace(description="Failing tool for testing")
+
+    def execute(self, **kwargs):
+        raise RuntimeError(self.message)
+
+
 class MockLLMProvider:
     """Mock LLM provider for testing."""
     
     def __init__(self, responses: list[str]):
         self.responses = responses
         self.call_count = 0
+        # Yield each response once, then repeat the last one
+        self._remaining = iter(responses)
+        self._last = responses[-1]
     
     async def generate(self, prompt: str, system_prompt: str = None, **kwargs):
         """Mock generate method."""
-        response = self.responses[min(self.call_count, len(self.responses) - 1)]
+        response = next(self._remaining, self._last)
         self.call_count += 1
         return LLMResponse(
             content=response,
@@ -158,8 +172,7 @@ async def test_execute_tool_not_found(agent):
 @pytest.mark.asyncio
 async def test_execute_tool_with_error(agent):
     """Test tool execution that raises error."""
-    mock_tool = Mock()
-    mock_tool.execute = Mock(side_effect=RuntimeError("Tool error"))
+    mock_tool = FailingTool("Tool error")
     
     runtime = AgentRuntime(agent=agent)
     runtime.set_tools({"failing_tool": mock_tool})
@@ -248,6 +261,34 @@ async def test_tool_chaining_context_update(agent):
     assert "tool_result_tool2" in context
 
 
+@pytest.mark.asyncio
+async def test_result_context_does_not_deep_copy_tool_results(agent):
+    """Test tool results are shared or shallow-copied into the result context."""
+    responses = [
+        '{"name": "tool1", "arguments": {}} {"name": "tool2", "arguments": {}}',
+        "Final response",
+    ]
+    nested = {"rows": [1, 2]}
+    runtime = AgentRuntime(agent=agent, llm_provider=MockLLMProvider(responses))
+    runtime.set_tools({
+        "tool1": MockTool(return_value="result1"),
+        "tool2": MockTool(return_value=nested),
+    })
+
+    context = {"user": {"name": "Ada"}}
+    result = await runtime.execute("Test task", context=context)
+
+    result_context = result["context"]
+    assert result_context["tool_result_tool1"] is context["tool_result_tool1"]
+    assert result_context["tool_result_tool2"] == nested
+    assert result_context["tool_result_tool2"] is not nested
+    assert result_context["tool_result_tool2"]["rows"] is nested["rows"]
+    # Other context entries are still deep-copied
+    assert result_context["user"] == {"name": "Ada"}
+    assert result_context["user"] is not context["user"]
+    assert "llm_provider" not in result_context
+
+
 # ==================== Tool Result Formatting Tests ====================
 
 @pytest.mark.asyncio
@@ -342,6 +383,97 @@ async def test_tool_integration_with_multiple_tools(agent):
     assert tool2.call_count == 1
 
 
+@pytest.mark.asyncio
+async def test_tools_in_one_response_run_concurrently(agent):
+    """Test that tool calls from the same response are executed concurrently."""
+    responses = [
+        '{"name": "tool1", "arguments": {}} {"name": "tool2", "arguments": {}}',
+        "Done",
+    ]
+    both_started = asyncio.Event()
+    started = []
+
+    class WaitingTool(MockTool):
+        parallel_safe = True
+
+        async def execute(self, **kwargs):
+            started.append(self.return_value)
+            if len(started) == 2:
+                both_started.set()
+            # Times out if the other tool can't start until this one finishes
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return await super().execute(**kwargs)
+
+    runtime = AgentRuntime(agent=agent, llm_provider=MockLLMProvider(responses))
+    tool1, tool2 = WaitingTool("one"), WaitingTool("two")
+    runtime.set_tools({"tool1": tool1, "tool2": tool2})
+
+    result = await runtime.execute("Task with two tools")
+
+    assert result["status"] == "completed"
+    assert tool1.call_count == 1
+    assert tool2.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_one_at_a_time_unless_parallel_safe(agent, monkeypatch):
+    """Test that concurrency is opt-in per tool and capped per response."""
+    running = 0
+    peak = 0
+
+    class TrackingTool(MockTool):
+        async def execute(self, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await super().execute(**kwargs)
+
+    class SafeTool(TrackingTool):
+        parallel_safe = True
+
+    calls = " ".join(f'{{"name": "tool{i}", "arguments": {{}}}}' for i in range(3))
+    runtime = AgentRuntime(agent=agent, llm_provider=MockLLMProvider([calls, "Done"]))
+    runtime.set_tools({"tool0": SafeTool(), "tool1": TrackingTool(), "tool2": SafeTool()})
+    await runtime.execute("Task with mixed tools")
+    assert peak == 1
+
+    peak = 0
+    monkeypatch.setattr(AgentRuntime, "MAX_PARALLEL_TOOL_CALLS", 2)
+    runtime = AgentRuntime(agent=agent, llm_provider=MockLLMProvider([calls, "Done"]))
+    runtime.set_tools({f"tool{i}": SafeTool() for i in range(3)})
+    await runtime.execute("Task with parallel-safe tools")
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_native_tool_call_failure_waits_for_other_calls(agent):
+    """Test that a failing native tool call is raised only after the rest finish."""
+
+    class SlowTool(MockTool):
+        async def execute(self, **kwargs):
+            await asyncio.sleep(0.01)
+            return await super().execute(**kwargs)
+
+    class ChatProvider(MockLLMProvider):
+        async def generate_chat(self, messages, **kwargs):
+            calls = [
+                {"id": f"call_{name}", "function": {"name": name, "arguments": "{}"}}
+                for name in ("broken", "slow")
+            ]
+            return LLMResponse(content="", model="gpt-4", metadata={"tool_calls": calls})
+
+    broken, slow = FailingTool("boom"), SlowTool()
+    broken.metadata.name, slow.metadata.name = "broken", "slow"
+    runtime = AgentRuntime(agent=agent, llm_provider=ChatProvider(["unused"]))
+    runtime.set_tools({"broken": broken, "slow": slow})
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await runtime._get_llm_response_with_tools("Task", "", {})
+    assert slow.call_count == 1
+
+
 # ==================== Error Handling Tests ====================
 
 @pytest.mark.asyncio
@@ -353,8 +485,7 @@ async def test_tool_error_handling(agent):
     ]
     mock_provider = MockLLMProvider(responses)
     
-    failing_tool = Mock()
-    failing_tool.execute = Mock(side_effect=RuntimeError("Tool failed"))
+    failing_tool = FailingTool("Tool failed")
     
     runtime = AgentRuntime(agent=agent, llm_provider=mock_provider)
     runtime.set_tools({"failing_tool": failing_tool})
@@ -375,8 +506,7 @@ async def test_partial_tool_failure(agent):
     mock_provider = MockLLMProvider(responses)
     
     tool1 = MockTool(return_value="success")
-    tool2 = Mock()
-    tool2.execute = Mock(side_effect=RuntimeError("Failed"))
+    tool2 = FailingTool("Failed")
     
     runtime = AgentRuntime(agent=agent, llm_provider=mock_provider)
     runtime.set_tools({"tool1": tool1, "tool2": tool2})
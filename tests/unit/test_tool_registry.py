@@ -31,6 +31,16 @@ def test_tool_registry_register_get_clear() -> None:
     assert ToolRegistry.get("dummy") is None
 
 
+def test_tool_registry_register_many() -> None:
+    ToolRegistry.clear()
+    tool = DummyTool()
+    ToolRegistry.register_many([tool, DummyTool()])
+    # Same-class duplicates are skipped, as with register().
+    assert ToolRegistry.get("dummy") is tool
+    assert len(ToolRegistry.list_all()) == 1
+    ToolRegistry.clear()
+
+
 def test_tool_registry_search_and_stats() -> None:
     ToolRegistry.clear()
     tool = DummyTool()
@@ -51,3 +61,40 @@ def test_tool_registry_export_schema_bundle() -> None:
     assert bundle["tool_count"] == 1
     assert bundle["schema_version"] == ToolRegistry.SCHEMA_VERSION
     ToolRegistry.clear()
+
+
+def test_tool_registry_indexes_follow_mutations() -> None:
+    ToolRegistry.clear()
+    tool = DummyTool()
+    ToolRegistry.register(tool)
+    assert ToolRegistry.get_by_tag("DEMO") == [tool]
+    assert ToolRegistry.get_by_category(ToolCategory.DATA) == [tool]
+    assert ToolRegistry.list_categories() == [ToolCategory.DATA]
+    assert ToolRegistry.search("dummy", category=ToolCategory.WEB) == []
+
+    bundle = ToolRegistry.export_schema_bundle(category=ToolCategory.DATA)
+    assert bundle["categories"] == {"data": 1}
+    bundle["tools"].clear()
+    assert ToolRegistry.export_schema_bundle(category=ToolCategory.DATA)["tool_count"] == 1
+
+    ToolRegistry.unregister("dummy")
+    assert ToolRegistry.get_by_tag("demo") == []
+    assert ToolRegistry.list_categories() == []
+    assert ToolRegistry.export_schema_bundle(category=ToolCategory.DATA)["tool_count"] == 0
+    ToolRegistry.clear()
+
+
+def test_tool_registry_restore() -> None:
+    ToolRegistry.clear()
+    kept = DummyTool()
+    ToolRegistry.register(kept)
+    snapshot = ToolRegistry.list_all()
+
+    ToolRegistry.clear()
+    assert ToolRegistry.get_by_tag("demo") == []
+
+    ToolRegistry.restore(snapshot)
+    assert ToolRegistry.list_all() == [kept]
+    assert ToolRegistry.get_by_tag("demo") == [kept]
+    assert ToolRegistry.get_by_category(ToolCategory.DATA) == [kept]
+    ToolRegistry.clear()
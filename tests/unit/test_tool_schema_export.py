@@ -84,4 +84,21 @@ def test_export_schema_bundle_to_yaml_file(tmp_path: Path):
         pytest.skip("PyYAML not installed")
 
     content = yaml.safe_load(Path(exported_path).read_text())
-    assert content["tool_count"] == 1
\ No newline at end of file
+    assert content["tool_count"] == 1
+
+
+def test_export_schema_bundle_reuses_tool_schema(tmp_path: Path):
+    tool = DummyTool("dummy", ToolCategory.WEB)
+    ToolRegistry.register(tool)
+
+    first = ToolRegistry.export_schema_bundle()
+    second = ToolRegistry.export_schema_bundle()
+    assert first["tools"][0] is tool.schema_dict
+    assert second["tools"][0] is tool.schema_dict
+    assert tool.get_schema() == tool.schema_dict
+
+    output_path = tmp_path / "schemas.json"
+    ToolRegistry.export_schema_bundle_to_file(str(output_path))
+    ToolRegistry.register(DummyTool("other", ToolCategory.FILE))
+    ToolRegistry.export_schema_bundle_to_file(str(output_path))
+    assert json.loads(output_path.read_text())["tool_count"] == 2
@@ -64,6 +64,35 @@ def test_text_processor_tool() -> None:
     asyncio.run(run())
 
 
+def test_text_processor_tool_operations() -> None:
+    tool = TextProcessorTool(
+        name="text",
+        description="Text",
+        category=ToolCategory.DATA,
+        tags=[],
+        config={"operation": "uppercase"},
+    )
+
+    async def run() -> None:
+        assert (await tool._execute("hi there", operation="word_count"))["result"] == 2
+        assert (await tool._execute("abc", operation="reverse"))["result"] == "cba"
+        with pytest.raises(ValueError):
+            await tool._execute("abc", operation="shout")
+
+    asyncio.run(run())
+
+
+def test_text_processor_tool_rejects_unknown_default_operation() -> None:
+    with pytest.raises(ValueError, match="Unknown operation"):
+        TextProcessorTool(
+            name="text",
+            description="Text",
+            category=ToolCategory.DATA,
+            tags=[],
+            config={"operation": "shout"},
+        )
+
+
 def test_data_transformer_tool_json_to_csv() -> None:
     tool = DataTransformerTool(
         name="transform",
@@ -84,3 +113,38 @@ def test_data_transformer_tool_json_to_csv() -> None:
         assert "value" in result["result"]
 
     asyncio.run(run())
+
+
+def test_data_transformer_tool_json_to_csv_quotes_fields() -> None:
+    tool = DataTransformerTool(
+        name="transform",
+        description="Transform",
+        category=ToolCategory.DATA,
+        tags=[],
+        config={"from_format": "json", "to_format": "csv"},
+    )
+
+    payload = json.dumps([{"name": "Doe, Jane", "value": 1}])
+
+    async def run() -> None:
+        result = await tool._execute(payload)
+        assert result["result"].splitlines() == ["name,value", '"Doe, Jane",1']
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("payload", ['[{"value": NaN}]', '[{"value": 1180591620717411303424}]'])
+def test_data_transformer_tool_accepts_json_orjson_rejects(payload) -> None:
+    tool = DataTransformerTool(
+        name="transform",
+        description="Transform",
+        category=ToolCategory.DATA,
+        tags=[],
+        config={"from_format": "json", "to_format": "csv"},
+    )
+
+    async def run() -> None:
+        result = await tool._execute(payload)
+        assert result["result"].splitlines() == ["value", str(json.loads(payload)[0]["value"])]
+
+    asyncio.run(run())
@@ -1,6 +1,11 @@
 """Tests for web tools."""
 
+import asyncio
+import json
+
+import httpx
 import pytest
+import pytest_asyncio
 from genxai.tools.builtin.web.web_scraper import WebScraperTool
 from genxai.tools.builtin.web.api_caller import APICallerTool
 from genxai.tools.builtin.web.http_client import HTTPClientTool
@@ -8,272 +13,288 @@ from genxai.tools.builtin.web.html_parser import HTMLParserTool
 from genxai.tools.builtin.web.url_validator import URLValidatorTool
 
 
-# ==================== Web Scraper Tool Tests ====================
+def _json_response(payload) -> httpx.Response:
+    # A streamed body, so the client reads it and records elapsed time
+    return httpx.Response(
+        200,
+        headers={"content-type": "application/json"},
+        stream=httpx.ByteStream(json.dumps(payload).encode()),
+    )
 
-@pytest.mark.asyncio
-async def test_web_scraper_initialization():
-    """Test web scraper tool initialization."""
-    tool = WebScraperTool()
-    assert tool.metadata.name == "web_scraper"
-    assert tool.metadata.category == "web"
-    assert len(tool.parameters) > 0
 
+def _httpbin(request: httpx.Request) -> httpx.Response:
+    """Serve the few httpbin.org endpoints these tests use, in-process."""
+    if request.url.host != "httpbin.org":
+        raise httpx.ConnectError("unknown host", request=request)
+    path = request.url.path
+    if path == "/get":
+        return _json_response({"args": dict(request.url.params), "url": str(request.url)})
+    if path == "/post":
+        return _json_response({"json": json.loads(request.content or b"null")})
+    if path == "/headers":
+        return _json_response({"headers": dict(request.headers)})
+    return httpx.Response(404, stream=httpx.ByteStream(b""))
 
-@pytest.mark.asyncio
-async def test_web_scraper_invalid_url():
-    """Test web scraper with invalid URL."""
-    tool = WebScraperTool()
-    result = await tool.execute(url="invalid-url")
-    assert result.success is False
-    assert result.error is not None
 
+@pytest_asyncio.fixture
+async def httpbin_client():
+    """httpx client whose requests to httpbin.org are answered by _httpbin."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_httpbin))
+    yield client
+    await client.aclose()
 
-@pytest.mark.asyncio
-async def test_web_scraper_nonexistent_url():
-    """Test web scraper with nonexistent URL."""
-    tool = WebScraperTool()
-    result = await tool.execute(url="https://nonexistent-domain-12345.com")
-    assert result.success is False
 
+@pytest.fixture(scope="module")
+def web_scraper():
+    return WebScraperTool()
 
-def test_web_scraper_metadata():
-    """Test web scraper metadata."""
-    tool = WebScraperTool()
-    assert "scrape" in tool.metadata.description.lower() or "web" in tool.metadata.description.lower()
-    assert len(tool.metadata.tags) > 0
 
+@pytest.fixture(scope="module")
+def api_caller():
+    return APICallerTool()
 
-# ==================== API Caller Tool Tests ====================
 
-@pytest.mark.asyncio
-async def test_api_caller_initialization():
-    """Test API caller tool initialization."""
-    tool = APICallerTool()
-    assert tool.metadata.name == "api_caller"
-    assert tool.metadata.category == "web"
+@pytest.fixture(scope="module")
+def http_client():
+    return HTTPClientTool()
 
 
-@pytest.mark.asyncio
-async def test_api_caller_get_request():
-    """Test API caller with GET request."""
-    tool = APICallerTool()
-    result = await tool.execute(
-        url="https://httpbin.org/get",
-        method="GET"
-    )
-    # Should either succeed or fail gracefully
-    assert result.success is True or result.success is False
+@pytest.fixture(scope="module")
+def html_parser():
+    return HTMLParserTool()
 
 
-@pytest.mark.asyncio
-async def test_api_caller_invalid_url():
-    """Test API caller with invalid URL."""
-    tool = APICallerTool()
-    result = await tool.execute(
-        url="invalid-url",
-        method="GET"
-    )
-    assert result.success is False
-    assert result.error is not None
+@pytest.fixture(scope="module")
+def url_validator():
+    return URLValidatorTool()
 
 
-@pytest.mark.asyncio
-async def test_api_caller_invalid_method():
-    """Test API caller with invalid HTTP method."""
-    tool = APICallerTool()
-    result = await tool.execute(
-        url="https://httpbin.org/get",
-        method="INVALID"
-    )
-    assert result.success is False
+# ==================== Shared Tool Tests ====================
 
+TOOL_MATRIX = [
+    ("web_scraper", ("scrape", "web")),
+    ("api_caller", ("api", "call")),
+    ("http_client", ("http", "client")),
+    ("html_parser", ("html", "parse")),
+    ("url_validator", ("url", "validate")),
+]
 
-def test_api_caller_metadata():
-    """Test API caller metadata."""
-    tool = APICallerTool()
-    assert "api" in tool.metadata.description.lower() or "call" in tool.metadata.description.lower()
 
+@pytest.mark.parametrize("name,keywords", TOOL_MATRIX)
+def test_tool_metadata(request, name, keywords):
+    """Test tool initialization and metadata."""
+    tool = request.getfixturevalue(name)
+    assert tool.metadata.name == name
+    assert tool.metadata.category == "web"
+    assert len(tool.parameters) > 0
+    assert len(tool.metadata.tags) > 0
+    assert any(word in tool.metadata.description.lower() for word in keywords)
 
-# ==================== HTTP Client Tool Tests ====================
 
-@pytest.mark.asyncio
-async def test_http_client_initialization():
-    """Test HTTP client tool initialization."""
-    tool = HTTPClientTool()
-    assert tool.metadata.name == "http_client"
-    assert tool.metadata.category == "web"
+@pytest.mark.parametrize("tool_cls", [WebScraperTool, APICallerTool, HTTPClientTool])
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tool_invalid_url(http_session, tool_cls):
+    """Test network tools with an invalid URL."""
+    tool = tool_cls(client=http_session)
+    result = await tool.execute(url="invalid-url")
+    assert result.success is False
+    assert result.error is not None
 
 
-@pytest.mark.asyncio
-async def test_http_client_get_request():
-    """Test HTTP client with GET request."""
-    tool = HTTPClientTool()
-    result = await tool.execute(
-        url="https://httpbin.org/get",
-        method="GET"
-    )
-    # Should either succeed or fail gracefully
-    assert result.success is True or result.success is False
+# ==================== Web Scraper Tool Tests ====================
 
+@pytest.mark.network
+@pytest.mark.asyncio(loop_scope="session")
+async def test_web_scraper_nonexistent_url(http_session):
+    """Test web scraper with nonexistent URL."""
+    tool = WebScraperTool(client=http_session)
+    result = await tool.execute(url="https://nonexistent-domain-12345.com")
+    assert result.success is False
 
-@pytest.mark.asyncio
-async def test_http_client_post_request():
-    """Test HTTP client with POST request."""
-    tool = HTTPClientTool()
-    result = await tool.execute(
-        url="https://httpbin.org/post",
-        method="POST",
-        data={"key": "value"}
-    )
-    # Should either succeed or fail gracefully
-    assert result.success is True or result.success is False
 
+# ==================== API Caller Tool Tests ====================
 
-@pytest.mark.asyncio
-async def test_http_client_with_headers():
-    """Test HTTP client with custom headers."""
-    tool = HTTPClientTool()
+async def test_api_caller_get_request(httpbin_client):
+    """Test API caller with GET request."""
+    tool = APICallerTool(client=httpbin_client)
     result = await tool.execute(
-        url="https://httpbin.org/headers",
+        url="https://httpbin.org/get",
         method="GET",
-        headers={"User-Agent": "GenXAI-Test"}
+        params={"q": "genxai"},
     )
-    # Should either succeed or fail gracefully
-    assert result.success is True or result.success is False
+    assert result.success is True
+    assert result.data["data"]["args"] == {"q": "genxai"}
 
 
-@pytest.mark.asyncio
-async def test_http_client_invalid_url():
-    """Test HTTP client with invalid URL."""
-    tool = HTTPClientTool()
+async def test_api_caller_invalid_method(httpbin_client):
+    """Test API caller with invalid HTTP method."""
+    tool = APICallerTool(client=httpbin_client)
     result = await tool.execute(
-        url="invalid-url",
-        method="GET"
+        url="https://httpbin.org/get",
+        method="INVALID"
     )
     assert result.success is False
 
 
-def test_http_client_metadata():
-    """Test HTTP client metadata."""
-    tool = HTTPClientTool()
-    assert "http" in tool.metadata.description.lower() or "client" in tool.metadata.description.lower()
+# ==================== HTTP Client Tool Tests ====================
+
+async def test_http_client_requests(httpbin_client):
+    """Test HTTP client GET, POST and custom-header requests on one client."""
+    tool = HTTPClientTool(client=httpbin_client)
+    get, post, with_headers = await asyncio.gather(
+        tool.execute(url="https://httpbin.org/get", method="GET"),
+        tool.execute(url="https://httpbin.org/post", method="POST"),
+        tool.execute(
+            url="https://httpbin.org/headers",
+            method="GET",
+            headers={"User-Agent": "GenXAI-Test"},
+        ),
+    )
 
+    assert get.success is True
+    assert get.data["content_type"] == "json"
+    assert post.success is True
+    assert post.data["method"] == "POST"
+    assert with_headers.success is True
+    assert with_headers.data["data"]["headers"]["user-agent"] == "GenXAI-Test"
 
-# ==================== HTML Parser Tool Tests ====================
 
-@pytest.mark.asyncio
-async def test_html_parser_initialization():
-    """Test HTML parser tool initialization."""
-    tool = HTMLParserTool()
-    assert tool.metadata.name == "html_parser"
-    assert tool.metadata.category == "web"
+async def test_http_client_warns_when_shared_client_ignores_options(httpbin_client, caplog):
+    """Test that per-call SSL/redirect options a shared client can't apply are flagged."""
+    tool = HTTPClientTool(client=httpbin_client)
+    with caplog.at_level("WARNING", logger="genxai.tools.builtin.web.http_client"):
+        await tool.execute(url="https://httpbin.org/get", max_redirects=10)
+        assert caplog.records == []
 
+        result = await tool.execute(url="https://httpbin.org/get", verify_ssl=False)
+    assert result.success is True
+    assert "verify_ssl=False" in caplog.text
 
-@pytest.mark.asyncio
-async def test_html_parser_parse_html():
+
+# ==================== HTML Parser Tool Tests ====================
+
+async def test_html_parser_parse_html(html_parser):
     """Test HTML parser with valid HTML."""
-    tool = HTMLParserTool()
     html = "<html><body><h1>Title</h1><p>Content</p></body></html>"
-    result = await tool.execute(html=html)
+    result = await html_parser.execute(html=html)
     assert result.success is True
     assert "parsed" in result.data or "elements" in result.data or "text" in result.data
 
 
-@pytest.mark.asyncio
-async def test_html_parser_extract_links():
+async def test_html_parser_extract_links(html_parser):
     """Test HTML parser extracting links."""
-    tool = HTMLParserTool()
     html = '<html><body><a href="https://example.com">Link</a></body></html>'
-    result = await tool.execute(
+    result = await html_parser.execute(
         html=html,
         extract="links"
     )
     assert result.success is True
 
 
-@pytest.mark.asyncio
-async def test_html_parser_extract_text():
+async def test_html_parser_extract_text(html_parser):
     """Test HTML parser extracting text."""
-    tool = HTMLParserTool()
     html = "<html><body><p>Hello World</p></body></html>"
-    result = await tool.execute(
+    result = await html_parser.execute(
         html=html,
         extract="text"
     )
     assert result.success is True
 
 
-@pytest.mark.asyncio
-async def test_html_parser_invalid_html():
-    """Test HTML parser with invalid HTML."""
-    tool = HTMLParserTool()
-    result = await tool.execute(html="<invalid>")
-    # Should handle gracefully
-    assert result.success is True or result.success is False
+async def test_html_parser_streams_large_document(html_parser):
+    """Test links/text extraction on a large document."""
+    rows = "".join(
+        f'<li><a href="/item/{i}"> Item {i} </a><span>note</span></li>' for i in range(5000)
+    )
+    html = f"<html><head><title> Catalog </title></head><body><ul>{rows}</ul></body></html>"
+
+    links = await html_parser.execute(html=html, extract="links")
+    assert links.success is True
+    assert links.data["title"] == "Catalog"
+    assert links.data["links_count"] == 5000
+    assert links.data["links"][-1] == {"href": "/item/4999", "text": "Item 4999"}
+
+    text = await html_parser.execute(html=html, extract="text")
+    assert text.data["text"].startswith("Catalog Item 0 note Item 1 note")
+
+
+async def test_html_parser_skips_script_and_style(html_parser):
+    """Test that script/style contents and nested link markup match get_text()."""
+    html = (
+        "<html><head><title>T</title><style>body{color:red}</style>"
+        "<script>var x = 1;</script></head><body>"
+        "<p>Hello <b>big</b> world</p>"
+        '<a href="/foo"> Foo<b>bar</b> </a>'
+        '<a href="/hidden"><noscript>ns</noscript>Shown</a>'
+        "<template><p>tmpl</p></template>"
+        "</body></html>"
+    )
 
+    text = await html_parser.execute(html=html, extract="text")
+    assert text.data["text"] == "T Hello big world Foo bar Shown"
 
-def test_html_parser_metadata():
-    """Test HTML parser metadata."""
-    tool = HTMLParserTool()
-    assert "html" in tool.metadata.description.lower() or "parse" in tool.metadata.description.lower()
+    links = await html_parser.execute(html=html, extract="links")
+    assert links.data["links"] == [
+        {"href": "/foo", "text": "Foobar"},
+        {"href": "/hidden", "text": "Shown"},
+    ]
 
 
-# ==================== URL Validator Tool Tests ====================
+async def test_html_parser_keeps_unclosed_and_nested_links(html_parser):
+    """Test that links missing their </a> are still extracted."""
+    unclosed = await html_parser.execute(html='<p><a href="/x">Foo</p>', extract="links")
+    assert unclosed.data["links"] == [{"href": "/x", "text": "Foo"}]
 
-@pytest.mark.asyncio
-async def test_url_validator_initialization():
-    """Test URL validator tool initialization."""
-    tool = URLValidatorTool()
-    assert tool.metadata.name == "url_validator"
-    assert tool.metadata.category == "web"
+    nested = await html_parser.execute(
+        html='<a href="/1">one<a href="/2">two</a>', extract="links"
+    )
+    assert nested.data["links"] == [
+        {"href": "/1", "text": "one"},
+        {"href": "/2", "text": "two"},
+    ]
+
+
+async def test_html_parser_invalid_html(html_parser):
+    """Test HTML parser with invalid HTML."""
+    result = await html_parser.execute(html="<invalid>")
+    # Should handle gracefully
+    assert result.success is True or result.success is False
 
 
-@pytest.mark.asyncio
-async def test_url_validator_valid_url():
+# ==================== URL Validator Tool Tests ====================
+
+async def test_url_validator_valid_url(url_validator):
     """Test URL validator with valid URL."""
-    tool = URLValidatorTool()
-    result = await tool.execute(url="https://www.example.com")
+    result = await url_validator.execute(url="https://www.example.com")
     assert result.success is True
     assert result.data.get("valid") is True
 
 
-@pytest.mark.asyncio
-async def test_url_validator_valid_http_url():
+async def test_url_validator_valid_http_url(url_validator):
     """Test URL validator with HTTP URL."""
-    tool = URLValidatorTool()
-    result = await tool.execute(url="http://example.com")
+    result = await url_validator.execute(url="http://example.com")
     assert result.success is True
     assert result.data.get("valid") is True
 
 
-@pytest.mark.asyncio
-async def test_url_validator_invalid_url():
+async def test_url_validator_invalid_url(url_validator):
     """Test URL validator with invalid URL."""
-    tool = URLValidatorTool()
-    result = await tool.execute(url="not-a-url")
+    result = await url_validator.execute(url="not-a-url")
     assert result.success is True
     assert result.data.get("valid") is False
 
 
-@pytest.mark.asyncio
-async def test_url_validator_url_with_path():
+async def test_url_validator_url_with_path(url_validator):
     """Test URL validator with URL containing path."""
-    tool = URLValidatorTool()
-    result = await tool.execute(url="https://example.com/path/to/page")
+    result = await url_validator.execute(url="https://example.com/path/to/page")
     assert result.success is True
     assert result.data.get("valid") is True
 
 
-@pytest.mark.asyncio
-async def test_url_validator_url_with_query():
+async def test_url_validator_url_with_query(url_validator):
     """Test URL validator with URL containing query parameters."""
-    tool = URLValidatorTool()
-    result = await tool.execute(url="https://example.com?param=value")
+    result = await url_validator.execute(url="https://example.com?param=value")
     assert result.success is True
     assert result.data.get("valid") is True
 
 
-def test_url_validator_metadata():
-    """Test URL validator metadata."""
-    tool = URLValidatorTool()
-    assert "url" in tool.metadata.description.lower() or "validate" in tool.metadata.description.lower()
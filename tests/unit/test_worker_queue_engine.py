@@ -1,12 +1,8 @@
 """Unit tests for the worker queue engine."""
 
-import asyncio
-import pytest
-
 from genxai.core.execution import WorkerQueueEngine
 
 
-@pytest.mark.asyncio
 async def test_worker_queue_engine_processes_payloads():
     engine = WorkerQueueEngine(worker_count=1)
     processed = []
@@ -18,17 +14,13 @@ async def test_worker_queue_engine_processes_payloads():
     await engine.enqueue({"value": 1}, handler)
     await engine.enqueue({"value": 2}, handler)
 
-    for _ in range(20):
-        if processed == [1, 2]:
-            break
-        await asyncio.sleep(0.05)
+    await engine.wait_idle(timeout=1.0)
 
     await engine.stop()
 
     assert processed == [1, 2]
 
 
-@pytest.mark.asyncio
 async def test_worker_queue_engine_retries():
     engine = WorkerQueueEngine(worker_count=1, max_retries=2, backoff_seconds=0)
     attempts = {"count": 0}
@@ -41,17 +33,13 @@ async def test_worker_queue_engine_retries():
     await engine.start()
     await engine.enqueue({"value": 1}, handler)
 
-    for _ in range(20):
-        if attempts["count"] >= 2:
-            break
-        await asyncio.sleep(0.05)
+    await engine.wait_idle(timeout=1.0)
 
     await engine.stop()
 
     assert attempts["count"] == 2
 
 
-@pytest.mark.asyncio
 async def test_worker_queue_engine_uses_registered_handler():
     engine = WorkerQueueEngine(worker_count=1)
     processed = []
@@ -64,11 +52,27 @@ async def test_worker_queue_engine_uses_registered_handler():
     await engine.start()
     await engine.enqueue({"value": 42}, handler_name="test")
 
-    for _ in range(20):
-        if processed == [42]:
-            break
-        await asyncio.sleep(0.05)
+    await engine.wait_idle(timeout=1.0)
 
     await engine.stop()
 
-    assert processed == [42]
\ No newline at end of file
+    assert processed == [42]
+
+
+async def test_worker_queue_engine_wait_idle_after_exhausted_retries():
+    engine = WorkerQueueEngine(worker_count=1, max_retries=1, backoff_seconds=0)
+    attempts = {"count": 0}
+
+    async def handler(payload: dict) -> None:
+        attempts["count"] += 1
+        raise ValueError("always fails")
+
+    await engine.wait_idle(timeout=1.0)  # nothing enqueued yet
+
+    await engine.start()
+    await engine.enqueue({"value": 1}, handler)
+    await engine.wait_idle(timeout=1.0)
+
+    await engine.stop()
+
+    assert attempts["count"] == 2
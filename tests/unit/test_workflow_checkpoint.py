@@ -2,45 +2,26 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+import json
+import math
+
 import pytest
 
 from genxai.core.agent.base import AgentFactory
 from genxai.core.agent.registry import AgentRegistry
+from genxai.core.graph import checkpoints
+from genxai.core.graph.checkpoints import WorkflowCheckpoint, WorkflowCheckpointManager
 from genxai.core.graph.engine import Graph
 from genxai.core.graph.nodes import InputNode, OutputNode, AgentNode
 from genxai.core.graph.edges import Edge
 from genxai.core.graph.nodes import NodeStatus
-from genxai.llm.base import LLMProvider, LLMResponse
-
-
-class MockLLMProvider(LLMProvider):
-    """Deterministic mock LLM provider for checkpoint tests."""
-
-    def __init__(self) -> None:
-        super().__init__(model="mock-model", temperature=0.0)
-
-    async def generate(
-        self,
-        prompt: str,
-        system_prompt: str | None = None,
-        **kwargs,
-    ) -> LLMResponse:
-        usage = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
-        self._update_stats(usage)
-        return LLMResponse(content="Mock response", model=self.model, usage=usage)
 
-    async def generate_stream(
-        self,
-        prompt: str,
-        system_prompt: str | None = None,
-        **kwargs,
-    ):
-        yield "Mock "
-        yield "response"
 
-
-@pytest.mark.asyncio
-async def test_checkpoint_round_trip_and_resume(tmp_path) -> None:
+@pytest.fixture(scope="module", autouse=True)
+def step_agent():
     agent = AgentFactory.create_agent(
         id="step",
         role="Checkpoint Agent",
@@ -48,15 +29,28 @@ async def test_checkpoint_round_trip_and_resume(tmp_path) -> None:
         llm_model="mock-model",
     )
     AgentRegistry.register(agent)
+    yield agent
+    AgentRegistry.unregister(agent.id)
+
 
+@pytest.fixture(scope="module")
+def checkpoint_graph():
     graph = Graph(name="checkpoint_demo")
     graph.add_node(InputNode())
     graph.add_node(AgentNode(id="step", agent_id="step"))
     graph.add_node(OutputNode())
     graph.add_edge(Edge(source="input", target="step"))
     graph.add_edge(Edge(source="step", target="output"))
+    return graph
+
 
-    state = await graph.run(input_data={"payload": 1}, llm_provider=MockLLMProvider())
+async def test_checkpoint_round_trip_and_resume(tmp_path, mock_llm, checkpoint_graph) -> None:
+    # The graph is shared by the module, so start from a fresh run
+    graph = checkpoint_graph
+    for node in graph.nodes.values():
+        node.status = NodeStatus.PENDING
+
+    state = await graph.run(input_data={"payload": 1}, llm_provider=mock_llm)
     state.pop("llm_provider", None)
     if isinstance(state.get("step"), dict):
         state["step"].pop("context", None)
@@ -74,9 +68,82 @@ async def test_checkpoint_round_trip_and_resume(tmp_path) -> None:
     resumed_state = await graph.run(
         input_data={"payload": 2},
         resume_from=checkpoint,
-        llm_provider=MockLLMProvider(),
+        llm_provider=mock_llm,
     )
     resumed_state.pop("llm_provider", None)
 
     assert resumed_state["input"]["payload"] == 2
-    assert "step" in resumed_state
\ No newline at end of file
+    assert "step" in resumed_state
+
+
+def test_checkpoint_file_matches_stdlib_json(tmp_path) -> None:
+    checkpoint = WorkflowCheckpoint(
+        name="typed",
+        workflow="demo",
+        created_at="2024-01-01T00:00:00",
+        state={"when": datetime(2024, 1, 1, 12, 30), "counts": {1: "one"}, "tags": ["a"]},
+        node_statuses={"step": "completed"},
+    )
+    path = WorkflowCheckpointManager(tmp_path).save(checkpoint)
+
+    assert json.loads(path.read_text()) == json.loads(
+        json.dumps(checkpoint.to_dict(), indent=2, default=str)
+    )
+    loaded = WorkflowCheckpointManager(tmp_path).load("typed")
+    assert loaded.state == {"when": "2024-01-01 12:30:00", "counts": {"1": "one"}, "tags": ["a"]}
+
+
+class _Color(Enum):
+    RED = 1
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_checkpoint_json_backends_agree(tmp_path, monkeypatch, use_orjson) -> None:
+    if use_orjson and not checkpoints.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(checkpoints, "ORJSON_AVAILABLE", use_orjson)
+    checkpoint = WorkflowCheckpoint(
+        name="mixed",
+        workflow="demo",
+        created_at="2024-01-01T00:00:00",
+        state={
+            "text": "café ☕",
+            "color": _Color.RED,
+            "point": _Point(1),
+            "score": float("nan"),
+        },
+        node_statuses={},
+    )
+    path = WorkflowCheckpointManager(tmp_path).save(checkpoint)
+    assert b"NaN" in path.read_bytes()
+
+    loaded = WorkflowCheckpointManager(tmp_path).load("mixed")
+    assert math.isnan(loaded.state.pop("score"))
+    assert loaded.state == {
+        "text": "café ☕",
+        "color": 1,
+        "point": "_Point(x=1)",
+    }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_checkpoint_keeps_big_ints_exact(tmp_path, monkeypatch, use_orjson) -> None:
+    if use_orjson and not checkpoints.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(checkpoints, "ORJSON_AVAILABLE", use_orjson)
+    checkpoint = WorkflowCheckpoint(
+        name="big",
+        workflow="demo",
+        created_at="2024-01-01T00:00:00",
+        state={"big": 2**70 + 1},
+        node_statuses={},
+    )
+    WorkflowCheckpointManager(tmp_path).save(checkpoint)
+
+    # orjson would read this back as a float
+    assert WorkflowCheckpointManager(tmp_path).load("big").state == {"big": 2**70 + 1}
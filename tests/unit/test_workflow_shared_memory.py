@@ -1,42 +1,14 @@
 """Tests for workflow-level shared memory wiring."""
 
 import pytest
-from typing import Any, Optional
 
 from genxai.core.agent.base import Agent, AgentConfig
 from genxai.core.agent.registry import AgentRegistry
 from genxai.core.graph.executor import WorkflowExecutor
-from genxai.llm.base import LLMProvider, LLMResponse
 
 
-class MockLLMProvider(LLMProvider):
-    """Deterministic mock LLM provider for workflow tests."""
-
-    def __init__(self) -> None:
-        super().__init__(model="mock-model", temperature=0.0)
-
-    async def generate(
-        self,
-        prompt: str,
-        system_prompt: Optional[str] = None,
-        **kwargs: Any,
-    ) -> LLMResponse:
-        usage = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
-        self._update_stats(usage)
-        return LLMResponse(content="Mock response", model=self.model, usage=usage)
-
-    async def generate_stream(
-        self,
-        prompt: str,
-        system_prompt: Optional[str] = None,
-        **kwargs: Any,
-    ):
-        yield "Mock "
-        yield "response"
-
-
-@pytest.mark.asyncio
-async def test_workflow_executor_shared_memory_context_injected() -> None:
+@pytest.fixture(scope="module", autouse=True)
+def agent_one():
     agent = Agent(
         id="agent_one",
         config=AgentConfig(
@@ -47,7 +19,11 @@ async def test_workflow_executor_shared_memory_context_injected() -> None:
         ),
     )
     AgentRegistry.register(agent)
+    yield agent
+    AgentRegistry.unregister(agent.id)
+
 
+async def test_workflow_executor_shared_memory_context_injected(mock_llm) -> None:
     nodes = [
         {"id": "start", "type": "input"},
         {"id": "agent_one", "type": "agent"},
@@ -65,7 +41,7 @@ async def test_workflow_executor_shared_memory_context_injected() -> None:
         edges=edges,
         input_data={"task": "hello"},
         shared_memory=True,
-        llm_provider=MockLLMProvider(),
+        llm_provider=mock_llm,
     )
 
     assert result["status"] == "success"
@@ -8,6 +8,8 @@ from genxai.llm.base import LLMProvider, LLMResponse
 class MockLLMProvider(LLMProvider):
     """Deterministic mock LLM provider for tests."""
 
+    _STREAM_CHUNKS = ("Mock ", "response")
+
     def __init__(
         self,
         model: str = "mock-model",
@@ -18,6 +20,11 @@ class MockLLMProvider(LLMProvider):
     ) -> None:
         super().__init__(model=model, temperature=temperature)
         self._response_text = response_text
+        self._usage = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
+        # Callers only read responses, so every generate() can return this one
+        self._response = LLMResponse(
+            content=response_text, model=model, usage=self._usage, finish_reason="stop"
+        )
 
     async def generate(
         self,
@@ -25,10 +32,8 @@ class MockLLMProvider(LLMProvider):
         system_prompt: Optional[str] = None,
         **kwargs: Any,
     ) -> LLMResponse:
-        content = self._response_text
-        usage = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
-        self._update_stats(usage)
-        return LLMResponse(content=content, model=self.model, usage=usage, finish_reason="stop")
+        self._update_stats(self._usage)
+        return self._response
 
     async def generate_stream(
         self,
@@ -36,5 +41,5 @@ class MockLLMProvider(LLMProvider):
         system_prompt: Optional[str] = None,
         **kwargs: Any,
     ) -> AsyncIterator[str]:
-        yield "Mock "
-        yield "response"
\ No newline at end of file
+        for chunk in self._STREAM_CHUNKS:
+            yield chunk
\ No newline at end of file